@@ -0,0 +1,240 @@
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from pydantic import BaseModel, Field
+from starlette.requests import Request
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.api.exc import api_error_handler, service_unavailable
+from app.infra.database.adapter import PoolWaitMonitor
+
+OTHER_ROUTES = "*"
+
+
+class AdmissionConfig(BaseModel):
+    concurrency: int = 8
+    queue_size: int = 32
+    queue_timeout: float = 2.0
+    target_pool_wait: float = 0.05
+    adapt_interval: float = 0.5
+    route_limits: dict[str, int] = Field(default_factory=dict)
+    exempt_paths: tuple[str, ...] = ("/health", "/meetings/live")
+
+
+def parse_route_limits(value: str) -> dict[str, int]:
+    """
+    Parse `ADMISSION_ROUTE_LIMITS`, e.g. `/files=2,/meetings=6`.
+
+    Raises:
+        ValueError: If an entry is not `<path prefix>=<positive integer>`.
+    """
+    limits: dict[str, int] = {}
+    for entry in filter(None, (part.strip() for part in value.split(","))):
+        prefix, _, limit = entry.partition("=")
+        prefix = prefix.strip()
+        if not prefix.startswith("/") or not limit.strip().isdigit():
+            raise ValueError(
+                f"Invalid route limit {entry!r}, expected e.g. /files=2"
+            )
+        if int(limit) < 1:
+            raise ValueError(f"Route limit {entry!r} must be at least 1")
+        limits[prefix] = int(limit)
+    return limits
+
+
+@dataclass
+class AdmissionGate:
+    """
+    Concurrency limit with a bounded FIFO queue for one group of routes.
+
+    Attributes:
+        max_limit: Concurrency allowed when the database pool is healthy.
+        queue_size: Maximum number of requests waiting for a slot.
+        limit: Current concurrency, lowered while the pool is saturated.
+        service_time: Moving average of the request duration, in seconds.
+    """
+
+    max_limit: int
+    queue_size: int
+    limit: int = field(init=False)
+    in_flight: int = 0
+    service_time: float = 0.05
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+
+    def __post_init__(self) -> None:
+        self.limit = self.max_limit
+
+    def estimated_wait(self) -> float:
+        """
+        Seconds a newly queued request is expected to wait for a slot.
+        """
+        return (len(self.waiters) + 1) * self.service_time / self.limit
+
+    async def acquire(self, timeout: float) -> bool:
+        """
+        Wait for a slot for at most `timeout` seconds.
+
+        Returns False right away when the queue is full or the expected wait
+        already exceeds the deadline, so the client is not kept waiting for
+        a response that would arrive too late.
+        """
+        if self.in_flight < self.limit and not self.waiters:
+            self.in_flight += 1
+            return True
+        if (
+            len(self.waiters) >= self.queue_size
+            or self.estimated_wait() > timeout
+        ):
+            return False
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except TimeoutError:
+            pass
+        except BaseException:
+            # The slot may have been handed over right before cancellation.
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+        return waiter.done() and not waiter.cancelled()
+
+    def release(self) -> None:
+        """
+        Free a slot and hand it to the oldest waiting request.
+        """
+        self.in_flight -= 1
+        self._wake()
+
+    def record(self, elapsed: float) -> None:
+        """
+        Fold the duration of a finished request into `service_time`.
+        """
+        self.service_time += 0.2 * (elapsed - self.service_time)
+
+    def resize(self, limit: int) -> None:
+        """
+        Change the current concurrency, bounded to [1, max_limit].
+        """
+        self.limit = max(1, min(limit, self.max_limit))
+        self._wake()
+
+    def _wake(self) -> None:
+        while self.waiters and self.in_flight < self.limit:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware that sheds load before it piles up on the database pool.
+
+    Requests are grouped by the longest prefix in `route_limits` or by the
+    first path segment of a mounted route, and each group gets its own
+    `AdmissionGate`. Any other path (unknown URLs, 404s) shares the single
+    `OTHER_ROUTES` gate, so arbitrary URLs cannot grow the gate table.
+    When a gate is full, requests wait in a bounded queue until
+    `queue_timeout`; after that, or when the queue is full, they fail fast
+    with 503 and `Retry-After`. Paths in `exempt_paths` are never queued;
+    long-lived streams such as the live updates must be listed there.
+
+    The limits follow the observed pool wait time: every `adapt_interval`
+    seconds they shrink multiplicatively while the average wait is above
+    `target_pool_wait` and grow back additively once it recovers.
+    """
+
+    def __init__(
+        self, app: ASGIApp, config: AdmissionConfig, pool_wait: PoolWaitMonitor
+    ) -> None:
+        self.app = app
+        self.config = config
+        self.pool_wait = pool_wait
+        self.scale = 1.0
+        self.adapted_at = time.perf_counter()
+        self.gates: dict[str, AdmissionGate] = {}
+        self.route_groups: set[str] = set()
+
+    def _is_routed(self, scope: Scope) -> bool:
+        app = scope.get("app", self.app)
+        return any(
+            route.matches(scope)[0] != Match.NONE
+            for route in getattr(app, "routes", ())
+        )
+
+    def _group(self, scope: Scope) -> str:
+        path = scope["path"]
+        prefixes = [
+            prefix
+            for prefix in self.config.route_limits
+            if path.startswith(prefix)
+        ]
+        if prefixes:
+            return max(prefixes, key=len)
+        group = "/" + path.lstrip("/").split("/", 1)[0]
+        if group in self.route_groups:
+            return group
+        # Only segments of mounted routes get a gate of their own.
+        if self._is_routed(scope):
+            self.route_groups.add(group)
+            return group
+        return OTHER_ROUTES
+
+    def _gate(self, group: str) -> AdmissionGate:
+        gate = self.gates.get(group)
+        if gate is None:
+            gate = AdmissionGate(
+                max_limit=self.config.route_limits.get(
+                    group, self.config.concurrency
+                ),
+                queue_size=self.config.queue_size,
+            )
+            gate.resize(math.ceil(gate.max_limit * self.scale))
+            self.gates[group] = gate
+        return gate
+
+    def _adapt(self) -> None:
+        now = time.perf_counter()
+        if now - self.adapted_at < self.config.adapt_interval:
+            return
+        self.adapted_at = now
+        if self.pool_wait.tick() > self.config.target_pool_wait:
+            scale = max(0.1, self.scale * 0.9)
+        else:
+            scale = min(1.0, self.scale + 0.02)
+        if scale == self.scale:
+            return
+        self.scale = scale
+        for gate in self.gates.values():
+            gate.resize(math.ceil(gate.max_limit * scale))
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http" or scope["path"] in self.config.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        gate = self._gate(self._group(scope))
+        if not await gate.acquire(self.config.queue_timeout):
+            retry_after = max(1, math.ceil(gate.estimated_wait()))
+            response = await api_error_handler(
+                Request(scope, receive), service_unavailable(retry_after)
+            )
+            await response(scope, receive, send)
+            return
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            gate.record(time.perf_counter() - started)
+            gate.release()
+            self._adapt()
@@ -0,0 +1,297 @@
+import hashlib
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+import brotli
+import zstandard
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class CompressionConfig(BaseModel):
+    minimum_size: int = 1024
+    encodings: tuple[str, ...] = ("zstd", "br", "gzip")
+    levels: dict[str, int] = {"zstd": 3, "br": 4, "gzip": 6}
+    content_types: tuple[str, ...] = (
+        "application/json",
+        "application/javascript",
+        "application/xml",
+        "image/svg+xml",
+        "text/css",
+        "text/csv",
+        "text/html",
+        "text/plain",
+    )
+    cache_size: int = 8 * 1024 * 1024
+
+
+class StreamCompressor(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it so the client can decode it now."""
+        ...
+
+    def finish(self) -> bytes:
+        """Terminate the compressed stream."""
+        ...
+
+
+class _GzipStream:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+@dataclass(frozen=True)
+class Encoder:
+    """One-shot and streaming compressors for a content coding."""
+
+    compress: Callable[[bytes, int], bytes]
+    stream: Callable[[int], StreamCompressor]
+
+
+ENCODERS: dict[str, Encoder] = {
+    "zstd": Encoder(
+        compress=lambda data, level: zstandard.ZstdCompressor(
+            level=level
+        ).compress(data),
+        stream=_ZstdStream,
+    ),
+    "br": Encoder(
+        compress=lambda data, level: brotli.compress(data, quality=level),
+        stream=_BrotliStream,
+    ),
+    "gzip": Encoder(compress=_gzip, stream=_GzipStream),
+}
+
+
+def negotiate(accept_encoding: str, encodings: Sequence[str]) -> str | None:
+    """
+    Pick the content coding to use for a response.
+
+    Args:
+        accept_encoding: Value of the request `Accept-Encoding` header.
+        encodings: Codings supported by the server, in preference order.
+
+    Returns:
+        str | None: The preferred coding among those with the highest
+                    q-value, or None if the client accepts none of them.
+    """
+    accepted: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in encodings:
+        quality = accepted.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class CompressedCache:
+    """
+    LRU of compressed bodies keyed by coding and a digest of the original.
+
+    Hashing a body is much cheaper than compressing it, so responses whose
+    bytes repeat (the same meeting list served to every member) are only
+    compressed once per coding.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+
+    def get_or_compress(
+        self, coding: str, body: bytes, compress: Callable[[bytes], bytes]
+    ) -> bytes:
+        key = (coding, hashlib.sha256(body).digest())
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            return cached
+        compressed = compress(body)
+        if len(compressed) <= self.max_bytes:
+            self._entries[key] = compressed
+            self.size += len(compressed)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+        return compressed
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses with zstd, brotli or gzip.
+
+    Complete bodies are compressed in one shot, skipped below
+    `minimum_size`, and cached already compressed only when the route opts
+    in with a shared `Cache-Control` (`public`, `max-age` or `s-maxage`,
+    without `private` or `no-store`). Streaming bodies are compressed chunk by chunk, flushing each
+    chunk so nothing is held back. Responses with an unlisted content type,
+    an existing `Content-Encoding`, a `Content-Range` or sent through
+    `pathsend` pass through untouched.
+    """
+
+    def __init__(self, app: ASGIApp, config: CompressionConfig) -> None:
+        self.app = app
+        self.config = config
+        self.cache = CompressedCache(config.cache_size)
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        coding = negotiate(
+            Headers(scope=scope).get("accept-encoding", ""),
+            [name for name in self.config.encodings if name in ENCODERS],
+        )
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, coding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    def __init__(
+        self, middleware: CompressionMiddleware, coding: str, send: Send
+    ) -> None:
+        self.middleware = middleware
+        self.coding = coding
+        self.level = middleware.config.levels[coding]
+        self.encoder = ENCODERS[coding]
+        self._send = send
+        self.start: Message | None = None
+        self.stream: StreamCompressor | None = None
+        self.passthrough = False
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        assert self.start is not None
+        content_type = headers.get("content-type", "").partition(";")[0]
+        return (
+            self.start["status"] not in (204, 206, 304)
+            and "content-encoding" not in headers
+            and "content-range" not in headers
+            and "no-transform" not in headers.get("cache-control", "")
+            and content_type.strip() in self.middleware.config.content_types
+        )
+
+    def _cacheable(self, headers: MutableHeaders) -> bool:
+        assert self.start is not None
+        directives = {
+            directive.strip().partition("=")[0].lower()
+            for directive in headers.get("cache-control", "").split(",")
+        }
+        return (
+            self.start["status"] == 200
+            and not directives & {"no-store", "private"}
+            and bool(directives & {"public", "max-age", "s-maxage"})
+        )
+
+    def _encode_headers(self, headers: MutableHeaders) -> None:
+        headers["content-encoding"] = self.coding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag is not None and not etag.startswith("W/"):
+            headers["etag"] = f"W/{etag}"
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if self.passthrough or self.start is None:
+            await self._send(message)
+            return
+        if self.stream is not None:
+            body = self.stream.compress(message.get("body", b""))
+            if not message.get("more_body", False):
+                body += self.stream.finish()
+            await self._send({**message, "body": body})
+            return
+
+        headers = MutableHeaders(raw=list(self.start["headers"]))
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if (
+            message["type"] != "http.response.body"
+            or not self._compressible(headers)
+            or (
+                not more_body
+                and len(body) < self.middleware.config.minimum_size
+            )
+        ):
+            self.passthrough = True
+            await self._send(self.start)
+            await self._send(message)
+            return
+
+        self._encode_headers(headers)
+        if more_body:
+            self.stream = self.encoder.stream(self.level)
+            del headers["content-length"]
+            await self._send({**self.start, "headers": headers.raw})
+            await self._send({**message, "body": self.stream.compress(body)})
+            return
+
+        if self._cacheable(headers):
+            body = self.middleware.cache.get_or_compress(
+                f"{self.coding}:{self.level}",
+                body,
+                lambda data: self.encoder.compress(data, self.level),
+            )
+        else:
+            body = self.encoder.compress(body, self.level)
+        headers["content-length"] = str(len(body))
+        await self._send({**self.start, "headers": headers.raw})
+        await self._send({**message, "body": body})
@@ -5,6 +5,8 @@ from .exceptions import (
     does_not_exist,
     environment_not_set,
     invalid_or_expired_token,
+    payload_too_large,
+    service_unavailable,
     unauthenticated,
     unauthorized_error,
     unexpected_error,
@@ -22,6 +24,8 @@ __all__ = [
     "unauthenticated",
     "unauthorized_error",
     "invalid_or_expired_token",
+    "payload_too_large",
+    "service_unavailable",
     "validation_error",
     "api_error_handler",
 ]
@@ -34,6 +34,7 @@ class APIError(Exception):
         detail: str | None = None,
         status_code: int = HTTPStatus.BAD_REQUEST,
         fields: list[FieldError] | None = None,
+        headers: dict[str, str] | None = None,
     ):
         """
         Initializes an APIError instance.
@@ -45,12 +46,15 @@ class APIError(Exception):
                                          Defaults to HTTPStatus.BAD_REQUEST.
             fields (list[FieldError] | None, optional): A list of FieldError objects
                                                         for validation errors. Defaults to None.
+            headers (dict[str, str] | None, optional): Extra HTTP headers to send
+                                                       with the error response. Defaults to None.
         """
         super().__init__(message)
         self.message = message
         self.detail = detail
         self.status_code = status_code
         self.fields = fields or []
+        self.headers = headers or {}
 
     def to_dict(self) -> dict:
         """
@@ -214,3 +218,38 @@ def validation_error(
         status_code=HTTPStatus.BAD_REQUEST,
         fields=fields,
     )
+
+
+def payload_too_large(limit: int) -> APIError:
+    """
+    Creates an APIError for a request body larger than the accepted limit.
+
+    Args:
+        limit (int): The maximum accepted size, in bytes.
+
+    Returns:
+        APIError: An APIError instance with status code 413 (REQUEST_ENTITY_TOO_LARGE).
+    """
+    return APIError(
+        message="Payload too large",
+        detail=f"The request body must not exceed {limit} bytes",
+        status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+    )
+
+
+def service_unavailable(retry_after: int) -> APIError:
+    """
+    Creates an APIError for a request shed because the server is overloaded.
+
+    Args:
+        retry_after (int): Seconds the client should wait before retrying,
+                           sent in the `Retry-After` header.
+
+    Returns:
+        APIError: An APIError instance with status code 503 (SERVICE_UNAVAILABLE).
+    """
+    return APIError(
+        message="Service temporarily overloaded, try again later",
+        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(retry_after)},
+    )
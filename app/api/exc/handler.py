@@ -10,7 +10,8 @@ async def api_error_handler(_: Request, exc: APIError) -> Response:
 
     This function acts as an exception handler for `APIError` instances.
     It converts the error details into a JSON response, sets the appropriate
-    HTTP status code, and includes an 'X-Error' header with the error message.
+    HTTP status code, and includes an 'X-Error' header with the error message
+    plus any extra headers carried by the error (e.g. 'Retry-After').
 
     :param _: The incoming request object (unused).
     :param exc: The APIError exception instance to be handled.
@@ -18,5 +19,7 @@ async def api_error_handler(_: Request, exc: APIError) -> Response:
              with the status code from `exc.status_code`, and an 'X-Error' header.
     """
     return ORJSONResponse(
-        exc.to_dict(), status_code=exc.status_code, headers={"X-Error": exc.message}
+        exc.to_dict(),
+        status_code=exc.status_code,
+        headers={"X-Error": exc.message, **exc.headers},
     )
@@ -0,0 +1,164 @@
+"""
+On-demand statistical profiling of single requests.
+
+A request is profiled when it carries `X-Profile: <PROFILING_TOKEN>` or is
+picked by `PROFILING_SAMPLE_RATE`. The whole request, middlewares
+included, runs under pyinstrument in async mode, so time spent in
+Pydantic validation, SQLAlchemy compilation, row processing or orjson
+shows up in the call tree while time awaiting the database shows as
+`await`. The response gets an `X-Profile-Id` header, and the profile can
+be downloaded from `GET /profiles/{profile_id}` as speedscope JSON or an
+HTML flamegraph.
+
+With no token and a zero sample rate the middleware is not installed at
+all, so profiling costs nothing unless it is enabled. Sampling requires a
+token, since profiles can only be downloaded with it, and long-lived
+streams listed in `exempt_paths` are never profiled.
+"""
+
+import random
+import re
+import secrets
+from enum import StrEnum
+from pathlib import Path
+from typing import Self
+
+import anyio
+from fastapi import Request
+from pydantic import BaseModel, model_validator
+from pyinstrument import Profiler
+from pyinstrument.renderers import HTMLRenderer, SpeedscopeRenderer
+from pyinstrument.session import Session
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typeid import TypeID
+
+PROFILE_ID_PATTERN = re.compile(r"^prof_[0-9a-z]{26}$")
+
+
+class ProfileFormat(StrEnum):
+    SPEEDSCOPE = "speedscope"
+    HTML = "html"
+
+
+class ProfilingConfig(BaseModel):
+    directory: Path = Path("storage/profiles")
+    token: str = ""
+    header: str = "x-profile"
+    sample_rate: float = 0.0
+    interval: float = 0.001
+    max_profiles: int = 200
+    exempt_paths: tuple[str, ...] = ("/meetings/live",)
+
+    @model_validator(mode="after")
+    def _sampling_needs_token(self) -> Self:
+        if self.sample_rate > 0 and not self.token:
+            raise ValueError(
+                "PROFILING_SAMPLE_RATE requires PROFILING_TOKEN, "
+                "otherwise the captured profiles cannot be downloaded"
+            )
+        return self
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any request can be profiled."""
+        return bool(self.token) or self.sample_rate > 0
+
+
+class ProfileStore:
+    """
+    Directory of captured profiles, keeping the `max_profiles` newest.
+
+    Profiles are stored as pyinstrument sessions and rendered on download,
+    so the same capture can be opened in speedscope or as HTML.
+    """
+
+    def __init__(self, config: ProfilingConfig) -> None:
+        self.config = config
+
+    def _path(self, profile_id: str) -> Path:
+        return self.config.directory / f"{profile_id}.json"
+
+    def authorized(self, token: str | None) -> bool:
+        """
+        Check the admin token sent by the client.
+        """
+        return bool(self.config.token) and secrets.compare_digest(
+            (token or "").encode(), self.config.token.encode()
+        )
+
+    def save(self, profile_id: str, session: Session) -> None:
+        self.config.directory.mkdir(parents=True, exist_ok=True)
+        session.save(self._path(profile_id))
+        # TypeIDs embed a UUIDv7, so the file names sort by creation time.
+        profiles = sorted(self.config.directory.glob("prof_*.json"))
+        for path in profiles[: -self.config.max_profiles]:
+            path.unlink(missing_ok=True)
+
+    def render(self, profile_id: str, fmt: ProfileFormat) -> str | None:
+        """
+        Render a stored profile, or return None if it does not exist.
+        """
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        try:
+            session = Session.load(self._path(profile_id))
+        except FileNotFoundError:
+            return None
+        if fmt is ProfileFormat.HTML:
+            return HTMLRenderer().render(session)
+        return SpeedscopeRenderer().render(session)
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling the requests selected by token or sampling.
+    """
+
+    def __init__(
+        self, app: ASGIApp, config: ProfilingConfig, store: ProfileStore
+    ) -> None:
+        self.app = app
+        self.config = config
+        self.store = store
+
+    def _selected(self, scope: Scope) -> bool:
+        if scope["path"] in self.config.exempt_paths:
+            return False
+        token = Headers(scope=scope).get(self.config.header)
+        if token is not None and self.store.authorized(token):
+            return True
+        return random.random() < self.config.sample_rate
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if scope["type"] != "http" or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+        profile_id = str(TypeID(prefix="prof"))
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["x-profile-id"] = profile_id
+            await send(message)
+
+        profiler = Profiler(interval=self.config.interval, async_mode="enabled")
+        profiler.start(target_description=f"{scope['method']} {scope['path']}")
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            session = profiler.stop()
+            # The response is already sent; write the file off the loop.
+            await anyio.to_thread.run_sync(self.store.save, profile_id, session)
+
+
+# FastAPI Integration #
+
+
+def get_profile_store(request: Request) -> ProfileStore:
+    """
+    Get the profile store of the application.
+    """
+    return request.app.state.profiles
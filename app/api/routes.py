@@ -1,5 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Header, Response
+from fastapi.concurrency import run_in_threadpool
 
+from app.api.exc import does_not_exist, unauthorized_error
+from app.api.profiling import ProfileFormat, ProfileStore, get_profile_store
+from app.evaluations.routes import router as evaluations_router
+from app.files.routes import router as files_router
 from app.meetings.routes import router as meetings_router
 
 router = APIRouter()
@@ -11,4 +16,39 @@ async def health_check():
     return {"status": "ok"}
 
 
+@router.get("/profiles/{profile_id}", tags=["Profiling"])
+async def get_profile(
+    profile_id: str,
+    format: ProfileFormat = ProfileFormat.SPEEDSCOPE,
+    x_profile: str | None = Header(default=None),
+    store: ProfileStore = Depends(get_profile_store),
+) -> Response:
+    """
+    Download a request profile captured by the profiling middleware.
+
+    Requires the `X-Profile` admin token. `format=speedscope` returns a
+    file for https://www.speedscope.app; `format=html` a flamegraph page.
+    """
+    if not store.authorized(x_profile):
+        raise unauthorized_error()
+    rendered = await run_in_threadpool(store.render, profile_id, format)
+    if rendered is None:
+        raise does_not_exist("Profile")
+    if format is ProfileFormat.HTML:
+        return Response(rendered, media_type="text/html")
+    return Response(
+        rendered,
+        media_type="application/json",
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{profile_id}.speedscope.json"'
+            )
+        },
+    )
+
+
 router.include_router(meetings_router, prefix="/meetings", tags=["Meetings"])
+router.include_router(files_router, prefix="/files", tags=["Files"])
+router.include_router(
+    evaluations_router, prefix="/avaliacoes", tags=["Evaluations"]
+)
@@ -0,0 +1,17 @@
+from enum import StrEnum
+
+
+class EvaluationStatus(StrEnum):
+    """Status of a class requirement or specialty under regional evaluation."""
+
+    PENDING = "Avaliação"
+    APPROVED = "Aprovado"
+    REDO = "Refazer"
+
+
+# Counter column kept in the progress tables for each status.
+STATUS_COUNTERS: dict[EvaluationStatus, str] = {
+    EvaluationStatus.PENDING: "em_avaliacao",
+    EvaluationStatus.APPROVED: "aprovados",
+    EvaluationStatus.REDO: "refazer",
+}
@@ -0,0 +1,162 @@
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import text
+
+from app.api.exc import does_not_exist
+from app.api.schemas import BaseResponseSchema
+
+from .concepts import EvaluationStatus
+from .schemas import (
+    ClassProgress,
+    Evaluation,
+    SpecialtyProgress,
+    UpdateEvaluationSchema,
+)
+
+
+def _approval_date(status: EvaluationStatus) -> date | None:
+    return date.today() if status is EvaluationStatus.APPROVED else None
+
+
+@dataclass
+class UpdateClassRequirementUseCase:
+    database_session: AsyncSession
+    id_avaliacao: int
+    payload: UpdateEvaluationSchema
+
+    async def execute(self) -> BaseResponseSchema[Evaluation]:
+        try:
+            # The progress counters follow through the table's trigger.
+            result = await self.database_session.execute(
+                text(
+                    """
+                    UPDATE avaliacao_classes
+                    SET status = :status, aproved_at = :aproved_at
+                    WHERE id = :id
+                    RETURNING id
+                    """
+                ),
+                {
+                    "id": self.id_avaliacao,
+                    "status": self.payload.status.value,
+                    "aproved_at": _approval_date(self.payload.status),
+                },
+            )
+            if result.one_or_none() is None:
+                raise does_not_exist("Evaluation")
+            await self.database_session.commit()
+        except BaseException:
+            await self.database_session.rollback()
+            raise
+        return BaseResponseSchema(
+            status=200,
+            message="Requirement evaluation updated successfully",
+            data=Evaluation(
+                id_avaliacao=self.id_avaliacao, status=self.payload.status
+            ),
+        )
+
+
+@dataclass
+class UpdateSpecialtyUseCase:
+    database_session: AsyncSession
+    id_avaliacao: int
+    payload: UpdateEvaluationSchema
+
+    async def execute(self) -> BaseResponseSchema[Evaluation]:
+        try:
+            # The progress counters follow through the table's trigger.
+            result = await self.database_session.execute(
+                text(
+                    """
+                    UPDATE avaliacao_especialidade
+                    SET status = :status, aproved_at = :aproved_at
+                    WHERE id = :id
+                    RETURNING id
+                    """
+                ),
+                {
+                    "id": self.id_avaliacao,
+                    "status": self.payload.status.value,
+                    "aproved_at": _approval_date(self.payload.status),
+                },
+            )
+            if result.one_or_none() is None:
+                raise does_not_exist("Evaluation")
+            await self.database_session.commit()
+        except BaseException:
+            await self.database_session.rollback()
+            raise
+        return BaseResponseSchema(
+            status=200,
+            message="Specialty evaluation updated successfully",
+            data=Evaluation(
+                id_avaliacao=self.id_avaliacao, status=self.payload.status
+            ),
+        )
+
+
+@dataclass
+class GetClassProgressUseCase:
+    database_session: AsyncSession
+    unidade_id: int | None = None
+
+    async def execute(self) -> BaseResponseSchema[list[ClassProgress]]:
+        result = await self.database_session.execute(
+            text(
+                """
+                SELECT p.id_unidade, p.codigo_classe,
+                       t.total AS total_requisitos,
+                       p.aprovados, p.em_avaliacao, p.refazer
+                FROM progresso_classes p
+                JOIN (
+                    SELECT codigo_classe, count(*) AS total
+                    FROM requisitos_classes
+                    GROUP BY codigo_classe
+                ) t ON t.codigo_classe = p.codigo_classe
+                WHERE CAST(:unidade_id AS integer) IS NULL
+                   OR p.id_unidade = :unidade_id
+                ORDER BY p.id_unidade, p.codigo_classe
+                """
+            ),
+            {"unidade_id": self.unidade_id},
+        )
+        return BaseResponseSchema(
+            status=200,
+            message="Class progress fetched successfully",
+            data=[
+                ClassProgress.model_validate(row, from_attributes=True)
+                for row in result.all()
+            ],
+        )
+
+
+@dataclass
+class GetSpecialtyProgressUseCase:
+    database_session: AsyncSession
+    unidade_id: int
+
+    async def execute(self) -> BaseResponseSchema[list[SpecialtyProgress]]:
+        result = await self.database_session.execute(
+            text(
+                """
+                SELECT p.codigo_sgc, p.codigo_especialidade,
+                       p.aprovados, p.em_avaliacao, p.refazer
+                FROM progresso_especialidades p
+                JOIN membros m ON m.codigo_sgc = p.codigo_sgc
+                WHERE m.id_unidade = :unidade_id
+                ORDER BY p.codigo_sgc, p.codigo_especialidade
+                """
+            ),
+            {"unidade_id": self.unidade_id},
+        )
+        return BaseResponseSchema(
+            status=200,
+            message="Specialty progress fetched successfully",
+            data=[
+                SpecialtyProgress.model_validate(row, from_attributes=True)
+                for row in result.all()
+            ],
+        )
@@ -0,0 +1,30 @@
+import sqlalchemy as sa
+
+from app.infra.database.adapter import metadata
+
+
+def _counter_columns() -> tuple[sa.Column[int], ...]:
+    return tuple(
+        sa.Column(name, sa.Integer, nullable=False, server_default="0")
+        for name in ("aprovados", "em_avaliacao", "refazer")
+    )
+
+
+# Counters of `avaliacao_classes` per (unit, class). The rows are written
+# by the database triggers, so they are keyed on that pair alone.
+CLASS_PROGRESS_TABLE = sa.Table(
+    "progresso_classes",
+    metadata,
+    sa.Column("id_unidade", sa.Integer, primary_key=True),
+    sa.Column("codigo_classe", sa.Text, primary_key=True),
+    *_counter_columns(),
+)
+
+# Counters of `avaliacao_especialidade` per (member, specialty).
+SPECIALTY_PROGRESS_TABLE = sa.Table(
+    "progresso_especialidades",
+    metadata,
+    sa.Column("codigo_sgc", sa.Text, primary_key=True),
+    sa.Column("codigo_especialidade", sa.Text, primary_key=True),
+    *_counter_columns(),
+)
@@ -0,0 +1,189 @@
+"""
+Precomputed completion counters for class and specialty evaluations.
+
+The counters are kept by the `atualiza_progresso` trigger (see `init.sql`),
+which adjusts them on every insert, update and delete of `avaliacao_classes`
+and `avaliacao_especialidade` in the same transaction as the write, so
+dashboards read one row per (unit, class) or (member, specialty) instead of
+aggregating `avaliacao_*` on every request.
+
+Run `python -m app.evaluations.progress check` to compare the counters with
+the source tables, and `rebuild` to recompute them from scratch.
+"""
+
+import asyncio
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.expression import text
+
+from .concepts import STATUS_COUNTERS
+from .entities import CLASS_PROGRESS_TABLE, SPECIALTY_PROGRESS_TABLE
+
+type Counters = dict[str, int]
+type ProgressKey = tuple[int | str, str]
+
+COUNTER_COLUMNS = tuple(STATUS_COUNTERS.values())
+
+_COUNTS = ", ".join(
+    f"count(*) FILTER (WHERE status = '{status}') AS {column}"
+    for status, column in STATUS_COUNTERS.items()
+)
+
+CLASS_PROGRESS_SOURCE = text(
+    f"""
+    SELECT ac.id_unidade, rc.codigo_classe, {_COUNTS}
+    FROM avaliacao_classes ac
+    JOIN requisitos_classes rc ON rc.id = ac.id_requisito
+    GROUP BY ac.id_unidade, rc.codigo_classe
+    """
+)
+
+SPECIALTY_PROGRESS_SOURCE = text(
+    f"""
+    SELECT codigo_sgc, codigo_especialidade, {_COUNTS}
+    FROM avaliacao_especialidade
+    GROUP BY codigo_sgc, codigo_especialidade
+    """
+)
+
+
+# Consistency check and rebuild #
+
+
+@dataclass(frozen=True)
+class ProgressMismatch:
+    table: str
+    key: ProgressKey
+    expected: Counters
+    actual: Counters
+
+
+async def _load_counters(
+    session: AsyncSession, query: sa.Executable
+) -> dict[ProgressKey, Counters]:
+    result = await session.execute(query)
+    return {
+        (row[0], row[1]): {
+            column: row[2 + i] for i, column in enumerate(COUNTER_COLUMNS)
+        }
+        for row in result.all()
+    }
+
+
+def _select_counters(table: sa.Table) -> sa.Select:
+    key_columns = [column.name for column in table.primary_key]
+    return sa.select(
+        *(table.c[column] for column in (*key_columns, *COUNTER_COLUMNS))
+    )
+
+
+def compare_counters(
+    table: str,
+    expected: Mapping[ProgressKey, Counters],
+    actual: Mapping[ProgressKey, Counters],
+) -> list[ProgressMismatch]:
+    """
+    List the keys whose stored counters differ from the expected ones.
+
+    Missing rows count as all zeros on either side.
+    """
+    zeros = dict.fromkeys(COUNTER_COLUMNS, 0)
+    return [
+        ProgressMismatch(
+            table=table,
+            key=key,
+            expected=expected.get(key, zeros),
+            actual=actual.get(key, zeros),
+        )
+        for key in sorted(expected.keys() | actual.keys(), key=str)
+        if expected.get(key, zeros) != actual.get(key, zeros)
+    ]
+
+
+async def check_progress(session: AsyncSession) -> list[ProgressMismatch]:
+    """
+    Compare the stored counters with the evaluation tables.
+    """
+    return compare_counters(
+        CLASS_PROGRESS_TABLE.name,
+        await _load_counters(session, CLASS_PROGRESS_SOURCE),
+        await _load_counters(session, _select_counters(CLASS_PROGRESS_TABLE)),
+    ) + compare_counters(
+        SPECIALTY_PROGRESS_TABLE.name,
+        await _load_counters(session, SPECIALTY_PROGRESS_SOURCE),
+        await _load_counters(
+            session, _select_counters(SPECIALTY_PROGRESS_TABLE)
+        ),
+    )
+
+
+async def rebuild_progress(session: AsyncSession) -> None:
+    """
+    Recompute every counter from the evaluation tables.
+
+    The counter tables are locked first, so the triggers of evaluations
+    written concurrently wait and apply their deltas on top of the rebuilt
+    rows.
+    The caller is responsible for committing.
+    """
+    _ = await session.execute(
+        text(
+            "LOCK TABLE progresso_classes, progresso_especialidades "
+            "IN EXCLUSIVE MODE"
+        )
+    )
+    for table, source in (
+        (CLASS_PROGRESS_TABLE, CLASS_PROGRESS_SOURCE),
+        (SPECIALTY_PROGRESS_TABLE, SPECIALTY_PROGRESS_SOURCE),
+    ):
+        key_columns = [column.name for column in table.primary_key]
+        counters = await _load_counters(session, source)
+        _ = await session.execute(sa.delete(table))
+        if counters:
+            _ = await session.execute(
+                sa.insert(table),
+                [
+                    {**dict(zip(key_columns, key, strict=True)), **values}
+                    for key, values in counters.items()
+                ],
+            )
+
+
+async def main(command: str) -> int:
+    from app.infra.database.adapter import DatabaseAdapter
+    from app.infra.database.config import DatabaseConfig
+    from app.settings import DATABASE_CONFIG
+
+    adapter = DatabaseAdapter(config=DatabaseConfig(connection=DATABASE_CONFIG))
+    session = await adapter.session.new()
+    try:
+        if command == "rebuild":
+            await rebuild_progress(session)
+            await session.commit()
+            print("Progress counters rebuilt")
+            return 0
+        mismatches = await check_progress(session)
+        for mismatch in mismatches:
+            print(
+                f"{mismatch.table} {mismatch.key}: "
+                f"expected {mismatch.expected}, found {mismatch.actual}"
+            )
+        print(f"{len(mismatches)} inconsistent progress row(s)")
+        return 1 if mismatches else 0
+    finally:
+        await adapter.session.release(session)
+        await adapter.aclose()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Check or rebuild the evaluation progress counters."
+    )
+    _ = parser.add_argument("command", choices=("check", "rebuild"))
+    sys.exit(asyncio.run(main(parser.parse_args().command)))
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.schemas import BaseResponseSchema
+from app.infra.database.adapter import get_database_session
+
+from .domain import (
+    GetClassProgressUseCase,
+    GetSpecialtyProgressUseCase,
+    UpdateClassRequirementUseCase,
+    UpdateSpecialtyUseCase,
+)
+from .schemas import (
+    ClassProgress,
+    Evaluation,
+    SpecialtyProgress,
+    UpdateEvaluationSchema,
+)
+
+router = APIRouter()
+
+
+@router.put("/requisitos/{id_avaliacao}")
+async def update_class_requirement(
+    id_avaliacao: int,
+    payload: UpdateEvaluationSchema,
+    database_session: AsyncSession = Depends(get_database_session),
+) -> BaseResponseSchema[Evaluation]:
+    use_case = UpdateClassRequirementUseCase(
+        database_session, id_avaliacao, payload
+    )
+    return await use_case.execute()
+
+
+@router.put("/especialidades/{id_avaliacao}")
+async def update_specialty(
+    id_avaliacao: int,
+    payload: UpdateEvaluationSchema,
+    database_session: AsyncSession = Depends(get_database_session),
+) -> BaseResponseSchema[Evaluation]:
+    use_case = UpdateSpecialtyUseCase(database_session, id_avaliacao, payload)
+    return await use_case.execute()
+
+
+@router.get("/progresso/classes")
+async def get_class_progress(
+    unidade_id: int | None = None,
+    database_session: AsyncSession = Depends(get_database_session),
+) -> BaseResponseSchema[list[ClassProgress]]:
+    use_case = GetClassProgressUseCase(database_session, unidade_id)
+    return await use_case.execute()
+
+
+@router.get("/progresso/especialidades")
+async def get_specialty_progress(
+    unidade_id: int,
+    database_session: AsyncSession = Depends(get_database_session),
+) -> BaseResponseSchema[list[SpecialtyProgress]]:
+    use_case = GetSpecialtyProgressUseCase(database_session, unidade_id)
+    return await use_case.execute()
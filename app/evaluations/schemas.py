@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+
+from .concepts import EvaluationStatus
+
+
+class UpdateEvaluationSchema(BaseModel):
+    status: EvaluationStatus
+
+
+class Evaluation(UpdateEvaluationSchema):
+    id_avaliacao: int
+
+
+class ClassProgress(BaseModel):
+    id_unidade: int
+    codigo_classe: str
+    total_requisitos: int
+    aprovados: int
+    em_avaliacao: int
+    refazer: int
+
+
+class SpecialtyProgress(BaseModel):
+    codigo_sgc: str
+    codigo_especialidade: str
+    aprovados: int
+    em_avaliacao: int
+    refazer: int
@@ -0,0 +1,105 @@
+import base64
+import binascii
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+
+from app.api.exc import FieldError, does_not_exist, validation_error
+from app.api.schemas import BaseResponseSchema
+from app.infra.storage.adapter import ObjectStorage, StoredObject
+
+from .schemas import StoredFile
+
+# Media types the browser may render; every other upload is downloaded.
+INLINE_CONTENT_TYPES = frozenset(
+    {"application/pdf", "image/gif", "image/jpeg", "image/png", "image/webp"}
+)
+
+
+def parse_content_digest(value: str) -> str:
+    """
+    Extract the hex SHA-256 from an RFC 9530 `Content-Digest` header.
+
+    Raises:
+        APIError: If the header carries no valid `sha-256` entry.
+    """
+    for entry in value.split(","):
+        algorithm, _, encoded = entry.strip().partition("=")
+        if algorithm.lower() != "sha-256":
+            continue
+        try:
+            digest = base64.b64decode(encoded.strip(":"), validate=True)
+        except binascii.Error:
+            break
+        if len(digest) == 32:
+            return digest.hex()
+    raise validation_error(
+        fields=[
+            FieldError(
+                name="Content-Digest",
+                detail="Expected a sha-256 digest, e.g. sha-256=:<base64>:",
+            )
+        ]
+    )
+
+
+def is_inline(content_type: str) -> bool:
+    """
+    Check whether a stored file may be displayed inline.
+
+    The media type comes from the uploader, so scriptable types such as
+    `text/html` or `image/svg+xml` must be sent as attachments.
+    """
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type in INLINE_CONTENT_TYPES
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check whether an `If-None-Match` header matches the given ETag.
+    """
+    candidates = {
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    }
+    return "*" in candidates or etag in candidates
+
+
+@dataclass
+class UploadFileUseCase:
+    storage: ObjectStorage
+    body: AsyncIterable[bytes]
+    content_type: str
+    content_digest: str | None = None
+
+    async def execute(self) -> BaseResponseSchema[StoredFile]:
+        checksum = (
+            parse_content_digest(self.content_digest)
+            if self.content_digest is not None
+            else None
+        )
+        stored = await self.storage.put_object(
+            self.body, content_type=self.content_type, checksum=checksum
+        )
+        return BaseResponseSchema(
+            status=200 if stored.deduplicated else 201,
+            message="File already stored"
+            if stored.deduplicated
+            else "File stored successfully",
+            data=StoredFile(
+                key=stored.key,
+                size=stored.size,
+                content_type=stored.content_type,
+                url=f"/files/{stored.key}",
+            ),
+        )
+
+
+@dataclass
+class GetFileUseCase:
+    storage: ObjectStorage
+    key: str
+
+    async def execute(self) -> StoredObject:
+        stored = await self.storage.head_object(self.key)
+        if stored is None:
+            raise does_not_exist("File")
+        return stored
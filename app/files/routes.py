@@ -0,0 +1,80 @@
+from urllib.parse import quote
+
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+
+from app.api.schemas import BaseResponseSchema
+from app.infra.storage.adapter import ObjectStorage, get_storage
+
+from .domain import GetFileUseCase, UploadFileUseCase, etag_matches, is_inline
+from .schemas import StoredFile
+
+router = APIRouter()
+
+
+@router.post("/", status_code=201)
+async def upload_file(
+    request: Request,
+    response: Response,
+    storage: ObjectStorage = Depends(get_storage),
+) -> BaseResponseSchema[StoredFile]:
+    """
+    Stream the raw request body into storage.
+
+    The body is never buffered in memory; send the file as-is with its
+    `Content-Type` and, optionally, a `Content-Digest: sha-256=:<b64>:`.
+    """
+    result = await UploadFileUseCase(
+        storage=storage,
+        body=request.stream(),
+        content_type=request.headers.get(
+            "content-type", "application/octet-stream"
+        ),
+        content_digest=request.headers.get("content-digest"),
+    ).execute()
+    response.status_code = result.status
+    return result
+
+
+@router.api_route("/{key}", methods=["GET", "HEAD"])
+async def download_file(
+    key: str,
+    request: Request,
+    filename: str | None = None,
+    storage: ObjectStorage = Depends(get_storage),
+) -> Response:
+    """
+    Download a stored file, honouring `Range` and `If-None-Match`.
+
+    Only PDFs and raster images are displayed inline; any other type is
+    sent with `Content-Disposition: attachment`.
+    """
+    stored = await GetFileUseCase(storage, key).execute()
+    headers = {
+        "ETag": stored.etag,
+        "Repr-Digest": stored.digest,
+        "Cache-Control": "public, max-age=31536000, immutable",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and etag_matches(if_none_match, stored.etag):
+        return Response(status_code=304, headers=headers)
+    if filename is None and not is_inline(stored.content_type):
+        headers["Content-Disposition"] = "attachment"
+    if stored.path is not None:
+        # Served through `http.response.pathsend` (sendfile) when the server
+        # supports it, with Range handled by FileResponse.
+        return FileResponse(
+            stored.path,
+            media_type=stored.content_type,
+            headers=headers,
+            filename=filename,
+        )
+    if filename is not None:
+        headers["Content-Disposition"] = (
+            f"attachment; filename*=utf-8''{quote(filename)}"
+        )
+    return StreamingResponse(
+        storage.get_object(key),
+        media_type=stored.content_type,
+        headers={**headers, "Content-Length": str(stored.size)},
+    )
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class StoredFile(BaseModel):
+    key: str
+    size: int
+    content_type: str
+    url: str
@@ -1,32 +1,105 @@
-from collections.abc import Awaitable, Callable
-from dataclasses import dataclass
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
 from functools import cached_property
 from typing import Any, cast
 
 import sqlalchemy as sa
 import sqlalchemy.ext.asyncio as sa_async
 from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from .config import DatabaseConfig
 
+CONNECT_TIME = "connect_time"
+
+
+@dataclass
+class PoolWaitMonitor:
+    """
+    Exponentially weighted average of the time spent queueing for a pooled
+    connection, used to detect pool saturation.
+
+    Readers call `tick` once per interval; an interval without any sample
+    counts as a zero wait, so the average decays while the pool is idle
+    instead of keeping the last spike.
+    """
+
+    alpha: float = 0.2
+    average: float = 0.0
+    samples: int = 0
+
+    def record(self, seconds: float) -> None:
+        """
+        Fold a new wait sample, in seconds, into the average.
+        """
+        self.average += self.alpha * (seconds - self.average)
+        self.samples += 1
+
+    def tick(self) -> float:
+        """
+        Close the current interval and return the average.
+        """
+        if not self.samples:
+            self.record(0.0)
+        self.samples = 0
+        return self.average
+
+
+def track_connect_time(engine: sa_async.AsyncEngine) -> None:
+    """
+    Keep, in the pool record `info`, how long opening each new physical
+    connection of `engine` took, so it is not mistaken for pool wait.
+    """
+
+    def started(
+        _dialect: sa.engine.Dialect,
+        record: ConnectionPoolEntry,
+        _cargs: tuple[Any, ...],
+        _cparams: dict[str, Any],
+    ) -> None:
+        record.info[CONNECT_TIME] = time.perf_counter()
+
+    def finished(
+        _dbapi_connection: DBAPIConnection, record: ConnectionPoolEntry
+    ) -> None:
+        record.info[CONNECT_TIME] = (
+            time.perf_counter() - record.info[CONNECT_TIME]
+        )
+
+    event.listen(engine.sync_engine, "do_connect", started)
+    event.listen(engine.sync_engine, "connect", finished)
+
 
 @dataclass
 class DatabaseAdapter:
     config: DatabaseConfig
     debug: bool = False
+    pool_wait: PoolWaitMonitor = field(default_factory=PoolWaitMonitor)
 
     @cached_property
     def engine(self) -> sa_async.AsyncEngine:
-        return sa_async.create_async_engine(
+        engine = sa_async.create_async_engine(
             self.config.make_uri(is_asyncio=True),
             pool_size=self.config.connection.pool.size,
             echo=self.debug,
             pool_recycle=self.config.connection.pool.recycle,
             max_overflow=self.config.connection.pool.max_overflow,
         )
+        track_connect_time(engine)
+        return engine
 
     async def new(self):
-        return await self.engine.connect()
+        engine = self.engine
+        started = time.perf_counter()
+        client = await engine.connect()
+        raw = await client.get_raw_connection()
+        # A checkout that opened a new connection only waited for the rest.
+        connecting = raw.info.pop(CONNECT_TIME, 0.0)
+        self.pool_wait.record(time.perf_counter() - started - connecting)
+        return client
 
     async def is_closed(self, client: sa_async.AsyncConnection) -> bool:
         return client.closed
@@ -178,17 +251,19 @@ class SessionAdapter:
 metadata = sa.MetaData()
 
 
-async def create_session_adapter(
-    provider: DatabaseAdapter,
-) -> sa_async.AsyncSession:
+async def get_database_session(
+    request: Request,
+) -> AsyncIterator[sa_async.AsyncSession]:
     """
-    Create a session adapter.
-    """
-    return await SessionAdapter(provider).new()
-
+    Open a session on its own pooled connection for the current request.
 
-def get_session_adapter(request: Request) -> DatabaseAdapter:
-    """
-    Get the session adapter.
+    The pool queue wait is recorded into the adapter's `PoolWaitMonitor`,
+    and the connection goes back to the pool once the response is sent.
     """
-    return request.app.state.session_adapter
+    adapter: DatabaseAdapter = request.app.state.database
+    session = await adapter.session.new()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await adapter.session.release(session)
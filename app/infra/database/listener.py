@@ -0,0 +1,118 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import asyncpg
+
+from .config import ConnectionConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PostgresListener:
+    """
+    Dedicated asyncpg connection that `LISTEN`s on a notification channel.
+
+    The connection lives outside the SQLAlchemy pool, so a worker holds
+    exactly one of them no matter how many clients consume the
+    notifications. When the connection drops it is reopened with
+    exponential backoff and `on_reconnect` is called, since notifications
+    sent in the meantime are lost. Any failure while connecting, listening
+    or waiting is logged and retried the same way.
+
+    A half-open TCP connection never reports its termination, so while
+    waiting the connection is probed with `SELECT 1` every
+    `probe_interval` seconds; a probe that fails or outlasts
+    `probe_timeout` is handled like a lost connection.
+
+    Attributes:
+        connection: Database the listener connects to.
+        channel: Notification channel to listen on.
+        on_notify: Called with the payload of every notification.
+        on_reconnect: Called after the connection is reopened.
+        min_backoff: First reconnect delay, in seconds.
+        max_backoff: Upper bound, in seconds, of the reconnect delay.
+        probe_interval: Idle seconds between liveness probes.
+        probe_timeout: Seconds a liveness probe may take.
+    """
+
+    connection: ConnectionConfig
+    channel: str
+    on_notify: Callable[[str], None]
+    on_reconnect: Callable[[], None] = lambda: None
+    min_backoff: float = 0.5
+    max_backoff: float = 30.0
+    probe_interval: float = 30.0
+    probe_timeout: float = 5.0
+    _task: asyncio.Task[None] | None = field(default=None, init=False)
+
+    async def _connect(self) -> asyncpg.Connection:
+        return await asyncpg.connect(
+            host=self.connection.host,
+            port=self.connection.port,
+            user=self.connection.user,
+            password=self.connection.password,
+            database=self.connection.name,
+        )
+
+    def _notify(self, _connection, _pid, _channel, payload: str) -> None:
+        self.on_notify(payload)
+
+    async def _listen(self) -> None:
+        backoff = self.min_backoff
+        connected_before = False
+        while True:
+            client: asyncpg.Connection | None = None
+            try:
+                client = await self._connect()
+                closed = asyncio.Event()
+                client.add_termination_listener(lambda _: closed.set())
+                await client.add_listener(self.channel, self._notify)
+                if connected_before:
+                    self.on_reconnect()
+                connected_before = True
+                backoff = self.min_backoff
+                while not closed.is_set():
+                    try:
+                        await asyncio.wait_for(
+                            closed.wait(), timeout=self.probe_interval
+                        )
+                    except TimeoutError:
+                        _ = await client.execute(
+                            "SELECT 1", timeout=self.probe_timeout
+                        )
+                logger.warning("LISTEN connection on %r lost", self.channel)
+            except Exception:
+                logger.exception(
+                    "LISTEN on %r failed, retrying in %.1f s",
+                    self.channel,
+                    backoff,
+                )
+            finally:
+                # terminate() cannot fail on a broken connection, unlike
+                # close(), so nothing escapes the retry loop.
+                if client is not None and not client.is_closed():
+                    client.terminate()
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def start(self) -> None:
+        """
+        Start listening in a background task.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def aclose(self) -> None:
+        """
+        Stop listening and close the connection.
+        """
+        if self._task is not None:
+            _ = self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,42 @@
+from granian.constants import HTTPModes, Interfaces, Loops
+from granian.http import HTTP1Settings
+from granian.log import LogLevels
+from granian.server import MPServer
+
+from .config import ServerConfig
+
+
+def create_server(target: str, config: ServerConfig) -> MPServer:
+    """
+    Create the Granian server for an ASGI application.
+
+    Args:
+        target: Import path of the application, e.g. "app.main:app".
+        config: Address and runtime tuning of the server.
+
+    Returns:
+        MPServer: The server, ready to `serve()`.
+    """
+    runtime = config.runtime
+    # Workers are processes, which the RSS based recycling relies on.
+    return MPServer(
+        target,
+        address=config.host,
+        port=config.port,
+        reload=False,
+        interface=Interfaces.ASGI,
+        workers=runtime.workers,
+        runtime_threads=runtime.runtime_threads,
+        runtime_blocking_threads=runtime.runtime_blocking_threads,
+        blocking_threads_idle_timeout=runtime.blocking_threads_idle_timeout,
+        loop=Loops(runtime.loop),
+        http=HTTPModes(runtime.http),
+        http1_settings=HTTP1Settings(keep_alive=runtime.keep_alive),
+        backlog=runtime.backlog,
+        backpressure=runtime.backpressure,
+        log_access=runtime.log_access,
+        log_level=LogLevels.info,
+        respawn_failed_workers=True,
+        workers_lifetime=runtime.workers_lifetime,
+        workers_max_rss=runtime.workers_max_rss,
+    )
@@ -0,0 +1,96 @@
+from enum import StrEnum
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class ServerProfile(StrEnum):
+    THROUGHPUT = "throughput"
+    LOW_LATENCY = "low-latency"
+    LOW_MEMORY = "low-memory"
+
+
+class RuntimeConfig(BaseModel):
+    """
+    Granian runtime tuning, applied to every worker.
+
+    Attributes:
+        workers: Number of worker processes.
+        runtime_threads: Rust threads serving the sockets of each worker.
+        runtime_blocking_threads: Rust threads for blocking I/O per worker.
+        blocking_threads_idle_timeout: Seconds an idle blocking thread lives.
+        backlog: Connections the kernel queues before refusing new ones.
+        backpressure: Connections a worker serves at once; further ones
+                      wait on the socket until one closes. None lets
+                      Granian use `backlog / workers`.
+        http: HTTP version accepted: "1", "2" or "auto" (both).
+        keep_alive: Keep HTTP/1 connections open between requests.
+        log_access: Write one access log line per request.
+        loop: Event loop used by the Python side of each worker.
+        workers_lifetime: Seconds after which a worker is replaced.
+        workers_max_rss: Memory, in MiB, above which a worker is replaced.
+    """
+
+    workers: int = 5
+    runtime_threads: int = 1
+    runtime_blocking_threads: int | None = None
+    blocking_threads_idle_timeout: int = 30
+    backlog: int = 1024
+    backpressure: int | None = None
+    http: Literal["auto", "1", "2"] = "auto"
+    keep_alive: bool = True
+    log_access: bool = False
+    loop: Literal["auto", "asyncio", "uvloop"] = "uvloop"
+    workers_lifetime: int | None = None
+    workers_max_rss: int | None = None
+
+    @property
+    def connection_budget(self) -> int:
+        """
+        Connections one worker serves at once, as Granian computes it.
+        """
+        return self.backpressure or self.backlog // self.workers
+
+
+class ServerConfig(BaseModel):
+    host: str = "0.0.0.0"
+    port: int = 8000
+    runtime: RuntimeConfig = Field(default_factory=RuntimeConfig)
+
+
+SERVER_PROFILES: dict[ServerProfile, RuntimeConfig] = {
+    # Many requests in flight per worker and two socket threads, so the
+    # event loop is never idle waiting for the database.
+    ServerProfile.THROUGHPUT: RuntimeConfig(
+        workers=5,
+        runtime_threads=2,
+        backlog=2048,
+        backpressure=256,
+        http="auto",
+        workers_max_rss=512,
+    ),
+    # HTTP/1 only and one socket thread per worker, so requests are not
+    # handed between threads. Granian counts backpressure in connections:
+    # it must stay above the keep-alive connections a worker holds, or the
+    # extra ones wait until another connection closes.
+    ServerProfile.LOW_LATENCY: RuntimeConfig(
+        workers=5,
+        runtime_threads=1,
+        backpressure=128,
+        http="1",
+        workers_max_rss=512,
+    ),
+    # Fewer workers and blocking threads, recycled periodically so
+    # fragmentation does not accumulate on small hosts.
+    ServerProfile.LOW_MEMORY: RuntimeConfig(
+        workers=2,
+        runtime_threads=1,
+        runtime_blocking_threads=16,
+        blocking_threads_idle_timeout=5,
+        backlog=512,
+        backpressure=64,
+        http="1",
+        workers_lifetime=6 * 60 * 60,
+        workers_max_rss=192,
+    ),
+}
@@ -0,0 +1,200 @@
+import base64
+import hashlib
+import re
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+from uuid import uuid4
+
+import anyio
+import orjson
+from fastapi import Request
+
+from app.api.exc import FieldError, payload_too_large, validation_error
+
+from .config import StorageConfig
+
+KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+
+@dataclass(frozen=True)
+class StoredObject:
+    """
+    Metadata of an object kept by a storage backend.
+
+    Objects are content-addressed: the key is the hex SHA-256 of the bytes,
+    so the same file uploaded many times is stored once.
+    """
+
+    key: str
+    size: int
+    content_type: str
+    path: Path | None = None
+    deduplicated: bool = False
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag derived from the content hash."""
+        return f'"{self.key}"'
+
+    @property
+    def digest(self) -> str:
+        """RFC 9530 `Repr-Digest` value for the object."""
+        encoded = base64.b64encode(bytes.fromhex(self.key)).decode()
+        return f"sha-256=:{encoded}:"
+
+
+class ObjectStorage(Protocol):
+    """
+    S3-style interface implemented by every storage backend.
+
+    Backends that keep objects on the local filesystem fill
+    `StoredObject.path`, which lets downloads be served with sendfile.
+    """
+
+    async def put_object(
+        self,
+        body: AsyncIterable[bytes],
+        *,
+        content_type: str,
+        checksum: str | None = None,
+    ) -> StoredObject: ...
+
+    async def head_object(self, key: str) -> StoredObject | None: ...
+
+    def get_object(self, key: str) -> AsyncIterator[bytes]: ...
+
+    async def delete_object(self, key: str) -> None: ...
+
+
+@dataclass
+class FilesystemStorage:
+    """
+    Content-addressed storage backed by a local directory.
+
+    Uploads are streamed chunk by chunk into a temporary file while being
+    hashed, then atomically moved to `objects/<aa>/<bb>/<sha256>`. A JSON
+    sidecar next to each object keeps its content type.
+    """
+
+    config: StorageConfig
+
+    def _object_path(self, key: str) -> anyio.Path:
+        return anyio.Path(self.config.objects_dir / key[:2] / key[2:4] / key)
+
+    def _meta_path(self, key: str) -> anyio.Path:
+        return self._object_path(key).with_suffix(".json")
+
+    async def put_object(
+        self,
+        body: AsyncIterable[bytes],
+        *,
+        content_type: str,
+        checksum: str | None = None,
+    ) -> StoredObject:
+        """
+        Stream `body` into the store and return the stored object.
+
+        Args:
+            body: Async iterable yielding the raw bytes of the upload.
+            content_type: Media type recorded for the object.
+            checksum: Optional hex SHA-256 the client claims for the body.
+
+        Raises:
+            APIError: If the body exceeds `max_upload_size` (413) or does not
+                      match `checksum` (400).
+        """
+        tmp_dir = anyio.Path(self.config.tmp_dir)
+        await tmp_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = tmp_dir / uuid4().hex
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            async with await anyio.open_file(tmp_path, "wb") as file:
+                async for chunk in body:
+                    size += len(chunk)
+                    if size > self.config.max_upload_size:
+                        raise payload_too_large(self.config.max_upload_size)
+                    hasher.update(chunk)
+                    _ = await file.write(chunk)
+            key = hasher.hexdigest()
+            if checksum is not None and checksum.lower() != key:
+                raise validation_error(
+                    message="Checksum mismatch",
+                    fields=[
+                        FieldError(
+                            name="Content-Digest",
+                            detail="The body does not match the informed digest",
+                        )
+                    ],
+                )
+            path = self._object_path(key)
+            existing = await self.head_object(key)
+            if existing is not None:
+                await tmp_path.unlink()
+                return StoredObject(
+                    key=existing.key,
+                    size=existing.size,
+                    content_type=existing.content_type,
+                    path=existing.path,
+                    deduplicated=True,
+                )
+            # A missing object or sidecar is rewritten from this upload.
+            await path.parent.mkdir(parents=True, exist_ok=True)
+            _ = await self._meta_path(key).write_bytes(
+                orjson.dumps({"content_type": content_type, "size": size})
+            )
+            _ = await tmp_path.replace(path)
+        except BaseException:
+            await tmp_path.unlink(missing_ok=True)
+            raise
+        return StoredObject(
+            key=key, size=size, content_type=content_type, path=Path(path)
+        )
+
+    async def head_object(self, key: str) -> StoredObject | None:
+        """
+        Return the metadata of `key`, or None if it is not stored.
+        """
+        if not KEY_PATTERN.match(key):
+            return None
+        path = self._object_path(key)
+        try:
+            stat_result = await path.stat()
+            meta = orjson.loads(await self._meta_path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        return StoredObject(
+            key=key,
+            size=stat_result.st_size,
+            content_type=meta["content_type"],
+            path=Path(path),
+        )
+
+    async def get_object(self, key: str) -> AsyncIterator[bytes]:
+        """
+        Yield the bytes of `key` in `chunk_size` pieces.
+        """
+        async with await anyio.open_file(self._object_path(key), "rb") as file:
+            while chunk := await file.read(self.config.chunk_size):
+                yield chunk
+
+    async def delete_object(self, key: str) -> None:
+        """
+        Remove `key` from the store; missing objects are ignored.
+        """
+        if not KEY_PATTERN.match(key):
+            return
+        await self._object_path(key).unlink(missing_ok=True)
+        await self._meta_path(key).unlink(missing_ok=True)
+
+
+# FastAPI Integration #
+
+
+def get_storage(request: Request) -> ObjectStorage:
+    """
+    Get the object storage configured for the application.
+    """
+    return request.app.state.storage
@@ -0,0 +1,19 @@
+from pathlib import Path
+
+from pydantic import BaseModel
+
+
+class StorageConfig(BaseModel):
+    root: Path
+    chunk_size: int = 64 * 1024
+    max_upload_size: int = 50 * 1024 * 1024
+
+    @property
+    def objects_dir(self) -> Path:
+        """Directory holding the content-addressed objects."""
+        return self.root / "objects"
+
+    @property
+    def tmp_dir(self) -> Path:
+        """Directory holding in-flight uploads before they are committed."""
+        return self.root / "tmp"
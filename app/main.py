@@ -4,27 +4,53 @@ from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.api.admission import AdmissionMiddleware
+from app.api.compression import CompressionMiddleware
 from app.api.exc import APIError, api_error_handler
+from app.api.profiling import ProfileStore, ProfilingMiddleware
 from app.api.routes import router
 from app.api.secure import secure_middleware
-from app.infra.database.adapter import DatabaseAdapter, create_session_adapter
+from app.infra.database.adapter import (
+    DatabaseAdapter,
+    PoolWaitMonitor,
+)
 from app.infra.database.config import DatabaseConfig
+from app.infra.database.listener import PostgresListener
+from app.infra.storage.adapter import FilesystemStorage
+from app.meetings.live import LIVE_CHANNEL, LiveHub
 from app.settings import (
+    ADMISSION_CONFIG,
+    COMPRESSION_CONFIG,
     DATABASE_CONFIG,
+    LIVE_CONFIG,
     LOCAL,
-    SERVER_HOST,
-    SERVER_PORT,
-    WORKERS,
+    PROFILING_CONFIG,
+    SERVER_CONFIG,
+    STORAGE_CONFIG,
 )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler for FastAPI"""
-    app.state.session_adapter = await create_session_adapter(
-        DatabaseAdapter(config=DatabaseConfig(connection=DATABASE_CONFIG))
+    app.state.database = DatabaseAdapter(
+        config=DatabaseConfig(connection=DATABASE_CONFIG),
+        pool_wait=app.state.pool_wait,
+    )
+    app.state.storage = FilesystemStorage(config=STORAGE_CONFIG)
+    app.state.live_hub = LiveHub(config=LIVE_CONFIG)
+    listener = PostgresListener(
+        connection=DATABASE_CONFIG,
+        channel=LIVE_CHANNEL,
+        on_notify=app.state.live_hub.publish,
+        on_reconnect=app.state.live_hub.resync,
     )
+    app.state.live_hub.start()
+    listener.start()
     yield
+    await listener.aclose()
+    await app.state.live_hub.aclose()
+    await app.state.database.aclose()
 
 
 def get_app() -> FastAPI:
@@ -52,6 +78,20 @@ def get_app() -> FastAPI:
     )
     app.add_exception_handler(APIError, api_error_handler)  # pyright: ignore[reportArgumentType]]
     app.add_middleware(BaseHTTPMiddleware, dispatch=secure_middleware)
+    app.add_middleware(CompressionMiddleware, config=COMPRESSION_CONFIG)
+    app.state.pool_wait = PoolWaitMonitor()
+    app.add_middleware(
+        AdmissionMiddleware,
+        config=ADMISSION_CONFIG,
+        pool_wait=app.state.pool_wait,
+    )
+    app.state.profiles = ProfileStore(config=PROFILING_CONFIG)
+    if PROFILING_CONFIG.enabled:
+        app.add_middleware(
+            ProfilingMiddleware,
+            config=PROFILING_CONFIG,
+            store=app.state.profiles,
+        )
     app.include_router(router=router)
     return app
 
@@ -59,17 +99,6 @@ def get_app() -> FastAPI:
 app = get_app()
 
 if __name__ == "__main__":
-    from granian.constants import Interfaces
-    from granian.log import LogLevels
-    from granian.server import Server
+    from app.infra.server.adapter import create_server
 
-    Server(
-        "app.main:app",
-        address=SERVER_HOST,
-        port=SERVER_PORT,
-        reload=False,
-        interface=Interfaces.ASGI,
-        log_access=True,
-        log_level=LogLevels.info,
-        workers=WORKERS,
-    ).serve()
+    create_server("app.main:app", SERVER_CONFIG).serve()
@@ -0,0 +1,9 @@
+from enum import StrEnum
+
+
+class LiveTopic(StrEnum):
+    """Tables whose changes are pushed to the live screens."""
+
+    CHAMADAS = "chamadas"
+    BONUS = "pontuacao_bonus"
+    CAIXA = "caixa"
@@ -0,0 +1,228 @@
+"""
+Live updates for the attendance, ranking and treasury screens.
+
+Triggers on `chamadas`, `pontuacao_bonus` and `caixa` send a `pg_notify`
+on every change. Each worker receives them on a single `LISTEN`
+connection (`PostgresListener`) and the `LiveHub` fans them out to the
+clients subscribed to `GET /meetings/live` as Server-Sent Events.
+Clients refetch the affected screen when an event arrives, instead of
+polling it.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, Iterable
+from dataclasses import dataclass, field
+
+import orjson
+from fastapi import Request
+from pydantic import BaseModel
+
+from .concepts import LiveTopic
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT = b": ping\n\n"
+
+# Hardcoded in `notify_live_change` (init.sql); change both together.
+LIVE_CHANNEL = "pc_live"
+
+
+class LiveConfig(BaseModel):
+    coalesce_window: float = 0.25
+    heartbeat_interval: float = 15.0
+    max_queue: int = 16
+    max_subscribers: int = 224
+    max_keys: int = 100
+    retry: int = 3000
+
+
+def subscriber_limit(
+    connection_budget: int, reserved: int, requested: int = 0
+) -> int:
+    """
+    Live streams a worker may hold without starving its other requests.
+
+    Each open stream keeps one of the worker's `connection_budget`
+    connections (Granian's backpressure) for as long as the screen is
+    open, so `reserved` connections are always left for the rest of the
+    API. `requested` lowers the limit further; 0 means no extra limit.
+    """
+    limit = max(0, connection_budget - reserved)
+    return min(requested, limit) if requested else limit
+
+
+def sse_event(event: str, data: object) -> bytes:
+    """
+    Encode one Server-Sent Event with a JSON payload.
+    """
+    return b"event: %s\ndata: %s\n\n" % (event.encode(), orjson.dumps(data))
+
+
+@dataclass(eq=False)
+class Subscription:
+    """
+    One connected client and the frames waiting to be sent to it.
+    """
+
+    topics: frozenset[LiveTopic]
+    queue: asyncio.Queue[bytes]
+    dropped: bool = False
+
+
+@dataclass
+class _Batch:
+    count: int = 0
+    keys: set[object] = field(default_factory=set)
+
+
+class LiveHub:
+    """
+    Fan-out of database change notifications to SSE subscribers.
+
+    Notifications are coalesced per topic for `coalesce_window` seconds,
+    so a whole attendance sheet saved at once becomes a single
+    `chamadas` event carrying the affected keys. Every frame is encoded
+    once and shared by all subscribers. A comment is sent every
+    `heartbeat_interval` seconds to keep proxies from closing idle
+    connections. A subscriber whose queue is full is dropped; the
+    browser reconnects after `retry` milliseconds and refetches.
+    """
+
+    def __init__(self, config: LiveConfig) -> None:
+        self.config = config
+        self.subscriptions: set[Subscription] = set()
+        self._pending: dict[LiveTopic, _Batch] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._heartbeat: asyncio.Task[None] | None = None
+
+    def subscribe(
+        self, topics: Iterable[LiveTopic] | None = None
+    ) -> Subscription | None:
+        """
+        Register a subscriber, or return None if the hub is full.
+        """
+        if len(self.subscriptions) >= self.config.max_subscribers:
+            return None
+        subscription = Subscription(
+            topics=frozenset(topics or LiveTopic),
+            queue=asyncio.Queue(self.config.max_queue),
+        )
+        self.subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self.subscriptions.discard(subscription)
+
+    async def stream(self, subscription: Subscription) -> AsyncGenerator[bytes]:
+        """
+        Yield the SSE frames of a subscription until it is dropped.
+        """
+        try:
+            yield b"retry: %d\n\n" % self.config.retry
+            while True:
+                frame = await subscription.queue.get()
+                if subscription.dropped:
+                    return
+                yield frame
+        finally:
+            self.unsubscribe(subscription)
+
+    def publish(self, payload: str) -> None:
+        """
+        Queue a notification sent by the `notify_live_change` trigger.
+        """
+        try:
+            message = orjson.loads(payload)
+            topic = LiveTopic(message["table"])
+        except (orjson.JSONDecodeError, KeyError, ValueError):
+            logger.warning("Ignoring live notification %r", payload)
+            return
+        batch = self._pending.setdefault(topic, _Batch())
+        batch.count += 1
+        if len(batch.keys) <= self.config.max_keys:
+            batch.keys.add(message.get("key"))
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.config.coalesce_window, self.flush
+            )
+
+    def flush(self) -> None:
+        """
+        Send the coalesced notifications to the subscribers.
+        """
+        self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        for topic, batch in pending.items():
+            keys = (
+                sorted(batch.keys, key=str)
+                if len(batch.keys) <= self.config.max_keys
+                else None
+            )
+            frame = sse_event(topic, {"count": batch.count, "keys": keys})
+            self._broadcast(frame, topic)
+
+    def resync(self) -> None:
+        """
+        Tell every subscriber to refetch, e.g. after notifications were lost.
+        """
+        self._broadcast(sse_event("resync", {}))
+
+    def _broadcast(self, frame: bytes, topic: LiveTopic | None = None) -> None:
+        for subscription in list(self.subscriptions):
+            if topic is None or topic in subscription.topics:
+                self._deliver(subscription, frame)
+
+    def _deliver(self, subscription: Subscription, frame: bytes) -> None:
+        try:
+            subscription.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self._drop(subscription)
+
+    def _drop(self, subscription: Subscription) -> None:
+        subscription.dropped = True
+        self.unsubscribe(subscription)
+        try:
+            # Wakes the stream if it is waiting on an empty queue.
+            subscription.queue.put_nowait(b"")
+        except asyncio.QueueFull:
+            pass
+
+    async def _send_heartbeats(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.heartbeat_interval)
+            self._broadcast(HEARTBEAT)
+
+    def start(self) -> None:
+        """
+        Start sending heartbeats.
+        """
+        if self._heartbeat is None:
+            self._heartbeat = asyncio.create_task(self._send_heartbeats())
+
+    async def aclose(self) -> None:
+        """
+        Stop the heartbeats and end every open stream.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._heartbeat is not None:
+            _ = self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat = None
+        for subscription in list(self.subscriptions):
+            self._drop(subscription)
+
+
+# FastAPI Integration #
+
+
+def get_live_hub(request: Request) -> LiveHub:
+    """
+    Get the live update hub of the worker.
+    """
+    return request.app.state.live_hub
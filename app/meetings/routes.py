@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.exc import service_unavailable
 from app.api.schemas import BaseResponseSchema
-from app.infra.database.adapter import get_session_adapter
+from app.infra.database.adapter import get_database_session
 
+from .concepts import LiveTopic
 from .domain import CreateMeetingsUseCase, GetMeetingsUseCase
+from .live import LiveHub, get_live_hub
 from .schemas import Meeting
 
 router = APIRouter()
@@ -12,7 +16,7 @@ router = APIRouter()
 
 @router.get("/")
 async def get_meetings(
-    database_session: AsyncSession = Depends(get_session_adapter),
+    database_session: AsyncSession = Depends(get_database_session),
 ):
     use_case = GetMeetingsUseCase(database_session)
     return await use_case.execute()
@@ -21,3 +25,26 @@ async def get_meetings(
 @router.post("/")
 async def create_meeting(meeting: Meeting) -> BaseResponseSchema:
     return await CreateMeetingsUseCase([meeting]).execute()
+
+
+@router.get("/live")
+async def live_updates(
+    topics: list[LiveTopic] | None = Query(default=None),
+    hub: LiveHub = Depends(get_live_hub),
+) -> StreamingResponse:
+    """
+    Server-Sent Events announcing changes to `chamadas`, `pontuacao_bonus`
+    and `caixa`, so screens refetch on change instead of polling.
+
+    Filter with `?topics=chamadas&topics=caixa`. Each event carries the
+    number of coalesced changes and their keys (`null` when there were
+    too many to list); a `resync` event asks for a full refetch.
+    """
+    subscription = hub.subscribe(topics)
+    if subscription is None:
+        raise service_unavailable(retry_after=hub.config.retry // 1000 or 1)
+    return StreamingResponse(
+        hub.stream(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,6 +1,18 @@
-from decouple import config
+from pathlib import Path
 
+from decouple import Choices, config
+
+from app.api.admission import AdmissionConfig, parse_route_limits
+from app.api.compression import CompressionConfig
+from app.api.profiling import ProfilingConfig
 from app.infra.database.config import ConnectionConfig, PoolConfig
+from app.infra.server.config import (
+    SERVER_PROFILES,
+    ServerConfig,
+    ServerProfile,
+)
+from app.infra.storage.config import StorageConfig
+from app.meetings.live import LiveConfig, subscriber_limit
 
 # LOG_LEVEL = config(
 #     "LOG_LEVEL",
@@ -10,7 +22,72 @@ from app.infra.database.config import ConnectionConfig, PoolConfig
 LOCAL = config("LOCAL", default=False, cast=bool)
 SERVER_HOST = str(config("SERVER_HOST", default="0.0.0.0", cast=str))
 SERVER_PORT = config("SERVER_PORT", default=8000, cast=int)
-WORKERS = config("WORKERS", default=5, cast=int)
+SERVER_PROFILE = ServerProfile(
+    config(
+        "SERVER_PROFILE",
+        default=ServerProfile.THROUGHPUT,
+        cast=Choices([profile.value for profile in ServerProfile]),
+    )
+)
+_PROFILE = SERVER_PROFILES[SERVER_PROFILE]
+WORKERS = config("WORKERS", default=_PROFILE.workers, cast=int)
+SERVER_RUNTIME_THREADS = config(
+    "SERVER_RUNTIME_THREADS", default=_PROFILE.runtime_threads, cast=int
+)
+SERVER_BLOCKING_THREADS = config(
+    "SERVER_BLOCKING_THREADS",
+    default=_PROFILE.runtime_blocking_threads or 0,
+    cast=int,
+)
+SERVER_BACKLOG = config("SERVER_BACKLOG", default=_PROFILE.backlog, cast=int)
+SERVER_BACKPRESSURE = config(
+    "SERVER_BACKPRESSURE", default=_PROFILE.backpressure or 0, cast=int
+)
+SERVER_HTTP = str(
+    config(
+        "SERVER_HTTP",
+        default=_PROFILE.http,
+        cast=Choices(["auto", "1", "2"]),
+    )
+)
+SERVER_KEEP_ALIVE = config(
+    "SERVER_KEEP_ALIVE", default=_PROFILE.keep_alive, cast=bool
+)
+SERVER_LOG_ACCESS = config(
+    "SERVER_LOG_ACCESS", default=_PROFILE.log_access, cast=bool
+)
+SERVER_LOOP = str(
+    config(
+        "SERVER_LOOP",
+        default=_PROFILE.loop,
+        cast=Choices(["auto", "asyncio", "uvloop"]),
+    )
+)
+SERVER_WORKERS_LIFETIME = config(
+    "SERVER_WORKERS_LIFETIME", default=_PROFILE.workers_lifetime or 0, cast=int
+)
+SERVER_WORKERS_MAX_RSS = config(
+    "SERVER_WORKERS_MAX_RSS", default=_PROFILE.workers_max_rss or 0, cast=int
+)
+SERVER_CONFIG = ServerConfig(
+    host=SERVER_HOST,
+    port=SERVER_PORT,
+    runtime=_PROFILE.model_copy(
+        update={
+            "workers": WORKERS,
+            "runtime_threads": SERVER_RUNTIME_THREADS,
+            "runtime_blocking_threads": SERVER_BLOCKING_THREADS or None,
+            "backlog": SERVER_BACKLOG,
+            "backpressure": SERVER_BACKPRESSURE or None,
+            "http": SERVER_HTTP,
+            "keep_alive": SERVER_KEEP_ALIVE,
+            "log_access": SERVER_LOG_ACCESS,
+            "loop": SERVER_LOOP,
+            "workers_lifetime": SERVER_WORKERS_LIFETIME or None,
+            "workers_max_rss": SERVER_WORKERS_MAX_RSS or None,
+        }
+    ),
+)
 
 DB_HOST = str(config("DB_HOST", default="localhost", cast=str))
 DB_PORT = config("DB_PORT", default=5432, cast=int)
@@ -28,3 +105,101 @@ DATABASE_CONFIG = ConnectionConfig(
         size=DB_POOL_SIZE,
     ),
 )
+
+STORAGE_ROOT = str(config("STORAGE_ROOT", default="storage", cast=str))
+STORAGE_CHUNK_SIZE = config("STORAGE_CHUNK_SIZE", default=64 * 1024, cast=int)
+STORAGE_MAX_UPLOAD_SIZE = config(
+    "STORAGE_MAX_UPLOAD_SIZE", default=50 * 1024 * 1024, cast=int
+)
+STORAGE_CONFIG = StorageConfig(
+    root=Path(STORAGE_ROOT),
+    chunk_size=STORAGE_CHUNK_SIZE,
+    max_upload_size=STORAGE_MAX_UPLOAD_SIZE,
+)
+
+ADMISSION_CONCURRENCY = config("ADMISSION_CONCURRENCY", default=8, cast=int)
+ADMISSION_QUEUE_SIZE = config("ADMISSION_QUEUE_SIZE", default=32, cast=int)
+ADMISSION_QUEUE_TIMEOUT = config(
+    "ADMISSION_QUEUE_TIMEOUT", default=2.0, cast=float
+)
+ADMISSION_TARGET_POOL_WAIT = config(
+    "ADMISSION_TARGET_POOL_WAIT", default=0.05, cast=float
+)
+ADMISSION_ADAPT_INTERVAL = config(
+    "ADMISSION_ADAPT_INTERVAL", default=0.5, cast=float
+)
+ADMISSION_ROUTE_LIMITS = str(
+    config("ADMISSION_ROUTE_LIMITS", default="", cast=str)
+)
+ADMISSION_CONFIG = AdmissionConfig(
+    concurrency=ADMISSION_CONCURRENCY,
+    queue_size=ADMISSION_QUEUE_SIZE,
+    queue_timeout=ADMISSION_QUEUE_TIMEOUT,
+    target_pool_wait=ADMISSION_TARGET_POOL_WAIT,
+    adapt_interval=ADMISSION_ADAPT_INTERVAL,
+    route_limits=parse_route_limits(ADMISSION_ROUTE_LIMITS),
+)
+
+COMPRESSION_MINIMUM_SIZE = config(
+    "COMPRESSION_MINIMUM_SIZE", default=1024, cast=int
+)
+COMPRESSION_ENCODINGS = str(
+    config("COMPRESSION_ENCODINGS", default="zstd,br,gzip", cast=str)
+)
+COMPRESSION_ZSTD_LEVEL = config("COMPRESSION_ZSTD_LEVEL", default=3, cast=int)
+COMPRESSION_BROTLI_LEVEL = config(
+    "COMPRESSION_BROTLI_LEVEL", default=4, cast=int
+)
+COMPRESSION_GZIP_LEVEL = config("COMPRESSION_GZIP_LEVEL", default=6, cast=int)
+COMPRESSION_CACHE_SIZE = config(
+    "COMPRESSION_CACHE_SIZE", default=8 * 1024 * 1024, cast=int
+)
+COMPRESSION_CONFIG = CompressionConfig(
+    minimum_size=COMPRESSION_MINIMUM_SIZE,
+    encodings=tuple(
+        name.strip()
+        for name in COMPRESSION_ENCODINGS.split(",")
+        if name.strip()
+    ),
+    levels={
+        "zstd": COMPRESSION_ZSTD_LEVEL,
+        "br": COMPRESSION_BROTLI_LEVEL,
+        "gzip": COMPRESSION_GZIP_LEVEL,
+    },
+    cache_size=COMPRESSION_CACHE_SIZE,
+)
+
+LIVE_COALESCE_WINDOW = config("LIVE_COALESCE_WINDOW", default=0.25, cast=float)
+LIVE_HEARTBEAT_INTERVAL = config(
+    "LIVE_HEARTBEAT_INTERVAL", default=15.0, cast=float
+)
+LIVE_MAX_QUEUE = config("LIVE_MAX_QUEUE", default=16, cast=int)
+LIVE_RESERVED_CONNECTIONS = config(
+    "LIVE_RESERVED_CONNECTIONS", default=32, cast=int
+)
+LIVE_MAX_SUBSCRIBERS = config("LIVE_MAX_SUBSCRIBERS", default=0, cast=int)
+LIVE_CONFIG = LiveConfig(
+    coalesce_window=LIVE_COALESCE_WINDOW,
+    heartbeat_interval=LIVE_HEARTBEAT_INTERVAL,
+    max_queue=LIVE_MAX_QUEUE,
+    max_subscribers=subscriber_limit(
+        SERVER_CONFIG.runtime.connection_budget,
+        reserved=LIVE_RESERVED_CONNECTIONS,
+        requested=LIVE_MAX_SUBSCRIBERS,
+    ),
+)
+
+PROFILING_DIR = str(
+    config("PROFILING_DIR", default="storage/profiles", cast=str)
+)
+PROFILING_TOKEN = str(config("PROFILING_TOKEN", default="", cast=str))
+PROFILING_SAMPLE_RATE = config("PROFILING_SAMPLE_RATE", default=0.0, cast=float)
+PROFILING_INTERVAL = config("PROFILING_INTERVAL", default=0.001, cast=float)
+PROFILING_MAX_PROFILES = config("PROFILING_MAX_PROFILES", default=200, cast=int)
+PROFILING_CONFIG = ProfilingConfig(
+    directory=Path(PROFILING_DIR),
+    token=PROFILING_TOKEN,
+    sample_rate=PROFILING_SAMPLE_RATE,
+    interval=PROFILING_INTERVAL,
+    max_profiles=PROFILING_MAX_PROFILES,
+)
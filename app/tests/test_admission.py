@@ -0,0 +1,227 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.api.admission import (
+    OTHER_ROUTES,
+    AdmissionConfig,
+    AdmissionGate,
+    AdmissionMiddleware,
+    parse_route_limits,
+)
+from app.infra.database.adapter import (
+    DatabaseAdapter,
+    PoolWaitMonitor,
+    get_database_session,
+    track_connect_time,
+)
+from app.infra.database.config import ConnectionConfig, DatabaseConfig
+from app.meetings.routes import router as meetings_router
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/meetings/")
+    async def meetings():
+        return []
+
+    return app
+
+
+def test_gate_queues_then_sheds():
+    async def scenario():
+        gate = AdmissionGate(max_limit=1, queue_size=1)
+        assert await gate.acquire(timeout=1)
+
+        queued = asyncio.create_task(gate.acquire(timeout=1))
+        await asyncio.sleep(0)
+        assert not await gate.acquire(timeout=1)  # queue is full
+
+        gate.release()
+        assert await queued
+        assert not await gate.acquire(timeout=0.01)  # deadline expires
+        assert gate.in_flight == 1 and not gate.waiters
+
+    asyncio.run(scenario())
+
+
+def test_route_limits_are_parsed_and_validated():
+    assert parse_route_limits("") == {}
+    assert parse_route_limits("/files=2, /meetings=6") == {
+        "/files": 2,
+        "/meetings": 6,
+    }
+    for value in ("/files", "files=2", "/files=two", "/files=0"):
+        with pytest.raises(ValueError):
+            _ = parse_route_limits(value)
+
+
+def test_full_route_returns_503_with_retry_after():
+    middleware = AdmissionMiddleware(
+        make_app(),
+        AdmissionConfig(concurrency=2, queue_size=0),
+        PoolWaitMonitor(),
+    )
+    client = TestClient(middleware)
+    gate = middleware._gate("/meetings")
+    gate.in_flight = gate.limit
+
+    shed = client.get("/meetings/")
+    health = client.get("/health")
+
+    assert shed.status_code == 503
+    assert int(shed.headers["retry-after"]) >= 1
+    assert shed.json()["status_code"] == 503
+    assert health.status_code == 200
+
+
+def test_unknown_paths_share_one_gate():
+    middleware = AdmissionMiddleware(
+        make_app(), AdmissionConfig(), PoolWaitMonitor()
+    )
+    client = TestClient(middleware)
+
+    for i in range(500):
+        assert client.get(f"/x{i}").status_code == 404
+    assert client.get("/meetings/").status_code == 200
+
+    assert set(middleware.gates) == {OTHER_ROUTES, "/meetings"}
+
+
+def test_limits_follow_pool_wait():
+    pool_wait = PoolWaitMonitor(average=1.0)
+    middleware = AdmissionMiddleware(
+        make_app(),
+        AdmissionConfig(concurrency=10, adapt_interval=0.0),
+        pool_wait,
+    )
+    gate = middleware._gate("/meetings")
+
+    for _ in range(10):
+        middleware._adapt()
+    assert gate.limit < 10
+
+    pool_wait.average = 0.0
+    for _ in range(100):
+        middleware._adapt()
+    assert gate.limit == 10
+
+
+def test_limits_adapt_once_per_interval_and_recover_when_idle():
+    pool_wait = PoolWaitMonitor(average=1.0)
+    middleware = AdmissionMiddleware(
+        make_app(),
+        AdmissionConfig(concurrency=10, adapt_interval=60.0),
+        pool_wait,
+    )
+    gate = middleware._gate("/meetings")
+
+    for _ in range(100):
+        middleware._adapt()
+    assert gate.limit == 10
+
+    # With no checkouts at all, the old spike decays and the limits return.
+    middleware.config.adapt_interval = 0.0
+    for _ in range(10):
+        middleware._adapt()
+    assert gate.limit < 10
+    for _ in range(100):
+        middleware._adapt()
+    assert pool_wait.average < 0.05
+    assert gate.limit == 10
+
+
+def test_opening_a_connection_is_not_pool_wait():
+    async def scenario():
+        database = DatabaseAdapter(
+            config=DatabaseConfig(
+                connection=ConnectionConfig(
+                    host="", user="", password="", name=""
+                )
+            )
+        )
+        database.engine = create_async_engine(
+            "sqlite+aiosqlite://", poolclass=AsyncAdaptedQueuePool
+        )
+        track_connect_time(database.engine)
+
+        @event.listens_for(database.engine.sync_engine, "do_connect")
+        def slow_handshake(*_) -> None:
+            time.sleep(0.05)
+
+        client = await database.new()
+        await database.release(client)
+        await database.aclose()
+
+        assert database.pool_wait.samples == 1
+        assert 0 <= database.pool_wait.average < 0.01
+
+    asyncio.run(scenario())
+
+
+def test_pool_wait_is_measured_on_every_request():
+    async def scenario():
+        pool_wait = PoolWaitMonitor()
+        database = DatabaseAdapter(
+            config=DatabaseConfig(
+                connection=ConnectionConfig(
+                    host="", user="", password="", name=""
+                )
+            ),
+            pool_wait=pool_wait,
+        )
+        database.engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+        )
+        track_connect_time(database.engine)
+        app = FastAPI()
+        app.state.database = database
+        app.include_router(meetings_router, prefix="/meetings")
+
+        @app.get("/reports/")
+        async def reports(
+            session: AsyncSession = Depends(get_database_session),
+        ):
+            await asyncio.sleep(0.02)
+            return []
+
+        middleware = AdmissionMiddleware(
+            app,
+            AdmissionConfig(
+                concurrency=10, target_pool_wait=0.01, adapt_interval=0.0
+            ),
+            pool_wait,
+        )
+        transport = httpx.ASGITransport(app=middleware)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            # Ten requests share a single pooled connection.
+            responses = await asyncio.gather(
+                *(client.get("/reports/") for _ in range(10))
+            )
+            assert all(r.status_code == 200 for r in responses)
+            assert pool_wait.average > 0.01
+            assert middleware.gates["/reports"].limit < 10
+
+            responses = [await client.get("/meetings/") for _ in range(20)]
+            assert responses[-1].json()["data"] == ["hello world"]
+            assert pool_wait.average < 0.01
+        await database.aclose()
+
+    asyncio.run(scenario())
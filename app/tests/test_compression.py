@@ -0,0 +1,128 @@
+import gzip
+
+import brotli
+import orjson
+import pytest
+import zstandard
+from fastapi import FastAPI, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.compression import (
+    CompressionConfig,
+    CompressionMiddleware,
+    negotiate,
+)
+
+ROWS = [{"codigo_sgc": str(i), "presenca": 10} for i in range(200)]
+
+DECODERS = {
+    "zstd": lambda data: (
+        zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    ),
+    "br": brotli.decompress,
+    "gzip": gzip.decompress,
+}
+
+
+@pytest.fixture
+def middleware() -> CompressionMiddleware:
+    app = FastAPI()
+
+    @app.get("/ranking")
+    async def ranking(response: Response):
+        response.headers["Cache-Control"] = "public, max-age=60"
+        return ROWS
+
+    @app.get("/private")
+    async def private(response: Response):
+        response.headers["Cache-Control"] = "private, max-age=60"
+        return ROWS
+
+    @app.get("/rows")
+    async def rows():
+        return ROWS
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream():
+        async def rows():
+            for row in ROWS:
+                yield orjson.dumps(row) + b"\n"
+
+        return StreamingResponse(rows(), media_type="text/plain")
+
+    @app.get("/file")
+    async def file():
+        return PlainTextResponse("x" * 4096, media_type="application/pdf")
+
+    return CompressionMiddleware(app, CompressionConfig())
+
+
+def fetch_raw(client: TestClient, path: str, coding: str):
+    with client.stream(
+        "GET", path, headers={"Accept-Encoding": coding}
+    ) as response:
+        return response, b"".join(response.iter_raw())
+
+
+def test_negotiate_honours_quality_and_server_preference():
+    encodings = ("zstd", "br", "gzip")
+    assert negotiate("gzip, br", encodings) == "br"
+    assert negotiate("zstd;q=0.5, gzip", encodings) == "gzip"
+    assert negotiate("*", encodings) == "zstd"
+    assert negotiate("identity", encodings) is None
+    assert negotiate("gzip;q=0", encodings) is None
+
+
+@pytest.mark.parametrize("coding", ["zstd", "br", "gzip"])
+def test_responses_are_compressed_with_negotiated_coding(middleware, coding):
+    client = TestClient(middleware)
+
+    response, raw = fetch_raw(client, "/ranking", coding)
+    streamed, streamed_raw = fetch_raw(client, "/stream", coding)
+
+    assert response.headers["content-encoding"] == coding
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert orjson.loads(DECODERS[coding](raw)) == ROWS
+    assert streamed.headers["content-encoding"] == coding
+    assert "content-length" not in streamed.headers
+    assert DECODERS[coding](streamed_raw).count(b"\n") == len(ROWS)
+
+
+def test_small_and_binary_responses_are_not_compressed(middleware):
+    client = TestClient(middleware)
+
+    small, _ = fetch_raw(client, "/health", "gzip")
+    binary, _ = fetch_raw(client, "/file", "gzip")
+
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in binary.headers
+
+
+def test_repeated_bodies_are_served_from_cache(middleware, monkeypatch):
+    client = TestClient(middleware)
+    _, first = fetch_raw(client, "/ranking", "br")
+    monkeypatch.setattr(
+        brotli, "compress", lambda *_, **__: pytest.fail("recompressed")
+    )
+
+    _, second = fetch_raw(client, "/ranking", "br")
+
+    assert first == second
+    assert middleware.cache.size == len(first)
+
+
+@pytest.mark.parametrize("path", ["/rows", "/private"])
+def test_only_shared_cacheable_responses_are_cached(middleware, path):
+    client = TestClient(middleware)
+
+    response, body = fetch_raw(client, path, "br")
+
+    assert response.headers["content-encoding"] == "br"
+    assert orjson.loads(brotli.decompress(body)) == ROWS
+    assert middleware.cache.size == 0
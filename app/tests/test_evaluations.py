@@ -0,0 +1,295 @@
+import asyncio
+import os
+import re
+from pathlib import Path
+from typing import cast
+
+import asyncpg
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlalchemy.sql.expression import text
+
+from app.evaluations.concepts import EvaluationStatus
+from app.evaluations.domain import (
+    UpdateClassRequirementUseCase,
+    UpdateSpecialtyUseCase,
+)
+from app.evaluations.entities import (
+    CLASS_PROGRESS_TABLE,
+    SPECIALTY_PROGRESS_TABLE,
+)
+from app.evaluations.progress import (
+    Counters,
+    ProgressKey,
+    check_progress,
+    compare_counters,
+)
+from app.evaluations.schemas import UpdateEvaluationSchema
+from app.infra.database.adapter import (
+    DatabaseAdapter,
+    get_database_session,
+    metadata,
+)
+from app.infra.database.config import ConnectionConfig, DatabaseConfig
+from app.main import app
+
+INIT_SQL = Path(__file__).parents[2] / "init.sql"
+
+FIXTURES = """
+INSERT INTO classe VALUES ('AM', 'Amigo');
+INSERT INTO requisitos_classes (codigo_classe, secao, requisito, texto)
+VALUES ('AM', 'Gerais', 1, 'Voto'), ('AM', 'Gerais', 2, 'Lei');
+INSERT INTO unidades (nome) VALUES ('Falcões');
+INSERT INTO membros (nome, codigo_sgc, id_unidade, cargo)
+VALUES ('Ana', '1001', 1, 'Desbravador');
+INSERT INTO especialidades VALUES ('AD-001', 'Nós e amarras');
+"""
+
+
+@pytest.fixture
+def postgres_url():
+    """
+    Create a scratch database from `init.sql` on the server given by
+    `TEST_DATABASE_URL` (e.g. postgresql+asyncpg://postgres@localhost/postgres).
+    """
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    server = make_url(url)
+    database = server.set(database=f"pc_test_{os.getpid()}")
+
+    async def run(statement: str, target=server) -> None:
+        engine = create_async_engine(
+            target, poolclass=NullPool, isolation_level="AUTOCOMMIT"
+        )
+        async with engine.connect() as connection:
+            raw = await connection.get_raw_connection()
+            driver = cast(asyncpg.Connection, raw.driver_connection)
+            _ = await driver.execute(statement)
+        await engine.dispose()
+
+    asyncio.run(run(f"DROP DATABASE IF EXISTS {database.database}"))
+    asyncio.run(run(f"CREATE DATABASE {database.database}"))
+    asyncio.run(run(INIT_SQL.read_text() + FIXTURES, database))
+    yield database
+    asyncio.run(run(f"DROP DATABASE {database.database} WITH (FORCE)"))
+
+
+async def _counters(session: AsyncSession, table: str) -> tuple[int, ...]:
+    result = await session.execute(
+        text(f"SELECT aprovados, em_avaliacao, refazer FROM {table}")
+    )
+    return tuple(result.one())
+
+
+def test_counters_follow_insert_then_approve(postgres_url):
+    async def scenario():
+        engine = create_async_engine(postgres_url, poolclass=NullPool)
+        async with AsyncSession(engine) as session:
+            _ = await session.execute(
+                text(
+                    """
+                    INSERT INTO avaliacao_classes
+                        (id_unidade, id_requisito, conclusao, status)
+                    VALUES (1, 1, now(), 'Avaliação'),
+                           (1, 2, now(), 'Avaliação');
+                    """
+                )
+            )
+            _ = await session.execute(
+                text(
+                    """
+                    INSERT INTO avaliacao_especialidade
+                        (codigo_sgc, codigo_especialidade, conclusao, status)
+                    VALUES ('1001', 'AD-001', now(), 'Avaliação')
+                    """
+                )
+            )
+            await session.commit()
+            assert await _counters(session, "progresso_classes") == (0, 2, 0)
+            assert await _counters(session, "progresso_especialidades") == (
+                0,
+                1,
+                0,
+            )
+
+            approve = UpdateEvaluationSchema(status=EvaluationStatus.APPROVED)
+            _ = await UpdateClassRequirementUseCase(
+                session, 1, approve
+            ).execute()
+            _ = await UpdateSpecialtyUseCase(session, 1, approve).execute()
+
+            assert await _counters(session, "progresso_classes") == (1, 1, 0)
+            assert await _counters(session, "progresso_especialidades") == (
+                1,
+                0,
+                0,
+            )
+
+            _ = await session.execute(
+                text("DELETE FROM avaliacao_classes WHERE id = 2")
+            )
+            assert await _counters(session, "progresso_classes") == (1, 0, 0)
+            assert await check_progress(session) == []
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_updates_use_their_own_sessions(postgres_url):
+    async def scenario():
+        database = DatabaseAdapter(
+            config=DatabaseConfig(
+                connection=ConnectionConfig(
+                    host="", user="", password="", name=""
+                )
+            )
+        )
+        database.engine = create_async_engine(postgres_url, pool_size=4)
+        app.state.database = database
+        async with database.engine.begin() as connection:
+            _ = await connection.execute(
+                text(
+                    """
+                    INSERT INTO avaliacao_classes
+                        (id_unidade, id_requisito, conclusao, status)
+                    VALUES (1, 1, now(), 'Avaliação'),
+                           (1, 2, now(), 'Avaliação');
+                    """
+                )
+            )
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            responses = await asyncio.gather(
+                *(
+                    client.put(
+                        f"/avaliacoes/requisitos/{id_avaliacao}",
+                        json={"status": status},
+                    )
+                    for _ in range(5)
+                    for id_avaliacao, status in (
+                        (1, "Aprovado"),
+                        (2, "Refazer"),
+                    )
+                )
+            )
+        assert [r.status_code for r in responses] == [200] * 10
+
+        async with AsyncSession(database.engine) as session:
+            assert await _counters(session, "progresso_classes") == (1, 0, 1)
+            assert await check_progress(session) == []
+        await database.aclose()
+        del app.state.database
+
+    asyncio.run(scenario())
+
+
+def _init_sql_statement(pattern: str) -> str:
+    match = re.search(pattern, INIT_SQL.read_text(), re.DOTALL)
+    assert match is not None, pattern
+    return match.group(0)
+
+
+def test_progress_tables_match_init_sql():
+    for table in (CLASS_PROGRESS_TABLE, SPECIALTY_PROGRESS_TABLE):
+        definition = _init_sql_statement(
+            rf"CREATE TABLE public\.{table.name} \(.*?\n\);"
+        )
+        columns = re.findall(r"^\t(\w+) ", definition, re.MULTILINE)
+        primary_key = re.search(r"PRIMARY KEY \((.*?)\)", definition)
+
+        assert [c for c in columns if c != "CONSTRAINT"] == table.c.keys()
+        assert primary_key is not None
+        assert primary_key.group(1).split(", ") == [
+            column.name for column in table.primary_key
+        ]
+
+
+def test_triggers_fire_on_every_counted_change():
+    for table, columns in (
+        ("avaliacao_classes", "status, id_unidade, id_requisito"),
+        (
+            "avaliacao_especialidade",
+            "status, codigo_sgc, codigo_especialidade",
+        ),
+    ):
+        trigger = _init_sql_statement(
+            rf"CREATE TRIGGER \w+ AFTER [^;]* ON public\.{table}\b[^;]*;"
+        )
+
+        assert f"AFTER INSERT OR DELETE OR UPDATE OF {columns} " in trigger
+        assert "FOR EACH ROW EXECUTE FUNCTION public.atualiza_progresso()" in (
+            trigger
+        )
+
+
+def test_check_progress_reports_drifted_counters():
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(metadata.create_all)
+            for statement in (
+                "CREATE TABLE requisitos_classes"
+                " (id integer, codigo_classe text)",
+                "CREATE TABLE avaliacao_classes"
+                " (id_unidade integer, id_requisito integer, status text)",
+                "CREATE TABLE avaliacao_especialidade"
+                " (codigo_sgc text, codigo_especialidade text, status text)",
+                "INSERT INTO requisitos_classes VALUES (1, 'AM'), (2, 'AM')",
+                "INSERT INTO avaliacao_classes"
+                " VALUES (1, 1, 'Aprovado'), (1, 2, 'Avaliação')",
+                "INSERT INTO progresso_classes"
+                " VALUES (1, 'AM', 1, 0, 0), (2, 'AM', 0, 0, 0)",
+                "INSERT INTO avaliacao_especialidade"
+                " VALUES ('1001', 'AD-001', 'Refazer')",
+                "INSERT INTO progresso_especialidades"
+                " VALUES ('1001', 'AD-001', 0, 0, 1)",
+            ):
+                _ = await connection.execute(text(statement))
+
+        async with AsyncSession(engine) as session:
+            mismatches = await check_progress(session)
+        await engine.dispose()
+
+        assert [(m.table, m.key) for m in mismatches] == [
+            ("progresso_classes", (1, "AM"))
+        ]
+        assert mismatches[0].expected["em_avaliacao"] == 1
+        assert mismatches[0].actual["em_avaliacao"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_compare_counters_treats_missing_rows_as_zero():
+    zeros = {"em_avaliacao": 0, "aprovados": 0, "refazer": 0}
+    expected: dict[ProgressKey, Counters] = {
+        (1, "AM"): {**zeros, "aprovados": 3},
+        (2, "AM"): zeros,
+    }
+    actual: dict[ProgressKey, Counters] = {
+        (1, "AM"): {**zeros, "aprovados": 2},
+        (3, "AM"): zeros,
+    }
+
+    mismatches = compare_counters("progresso_classes", expected, actual)
+
+    assert [mismatch.key for mismatch in mismatches] == [(1, "AM")]
+    assert mismatches[0].actual["aprovados"] == 2
+
+
+def test_update_requirement_rejects_unknown_status():
+    app.dependency_overrides[get_database_session] = lambda: None
+    try:
+        response = TestClient(app).put(
+            "/avaliacoes/requisitos/1", json={"status": "Concluído"}
+        )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 422
@@ -0,0 +1,100 @@
+import base64
+import hashlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.infra.storage.adapter import FilesystemStorage, get_storage
+from app.infra.storage.config import StorageConfig
+from app.main import app
+
+PDF = b"%PDF-1.7\n" + b"0123456789" * 1000
+
+
+@pytest.fixture
+def client(tmp_path):
+    storage = FilesystemStorage(
+        config=StorageConfig(root=tmp_path, max_upload_size=64 * 1024)
+    )
+    app.dependency_overrides[get_storage] = lambda: storage
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def upload(client: TestClient, body: bytes, **headers: str):
+    return client.post(
+        "/files/",
+        content=body,
+        headers={"Content-Type": "application/pdf", **headers},
+    )
+
+
+def test_upload_is_content_addressed(client, tmp_path):
+    first = upload(client, PDF)
+    second = upload(client, PDF)
+
+    key = hashlib.sha256(PDF).hexdigest()
+    assert first.status_code == 201
+    assert second.status_code == 200
+    assert first.json()["data"]["key"] == key
+    assert second.json()["message"] == "File already stored"
+    assert len(list((tmp_path / "objects").rglob(key))) == 1
+    assert not list((tmp_path / "tmp").iterdir())
+
+
+def test_upload_restores_a_missing_sidecar(client, tmp_path):
+    _ = upload(client, PDF)
+    key = hashlib.sha256(PDF).hexdigest()
+    for sidecar in (tmp_path / "objects").rglob(f"{key}.json"):
+        sidecar.unlink()
+
+    response = upload(client, PDF)
+
+    assert response.status_code == 201
+    assert client.get(f"/files/{key}").content == PDF
+    assert not list((tmp_path / "tmp").iterdir())
+
+
+def test_upload_rejects_wrong_digest_and_large_bodies(client, tmp_path):
+    digest = base64.b64encode(hashlib.sha256(b"other").digest()).decode()
+
+    mismatch = upload(client, PDF, **{"Content-Digest": f"sha-256=:{digest}:"})
+    too_large = upload(client, b"x" * (64 * 1024 + 1))
+
+    assert mismatch.status_code == 400
+    assert too_large.status_code == 413
+    assert not list((tmp_path / "tmp").iterdir())
+
+
+def test_download_supports_etag_and_range(client):
+    key = upload(client, PDF).json()["data"]["key"]
+
+    full = client.get(f"/files/{key}")
+    partial = client.get(f"/files/{key}", headers={"Range": "bytes=0-7"})
+    cached = client.get(f"/files/{key}", headers={"If-None-Match": f'"{key}"'})
+
+    assert full.content == PDF
+    assert full.headers["etag"] == f'"{key}"'
+    assert full.headers["content-type"] == "application/pdf"
+    assert full.headers["repr-digest"].startswith("sha-256=:")
+    assert partial.status_code == 206
+    assert partial.content == PDF[:8]
+    assert cached.status_code == 304
+    assert client.get("/files/unknown").status_code == 404
+
+
+def test_only_safe_types_are_displayed_inline(client):
+    html = b"<script>alert(document.cookie)</script>"
+    key = upload(client, html, **{"Content-Type": "text/html"}).json()["data"][
+        "key"
+    ]
+    pdf_key = upload(client, PDF).json()["data"]["key"]
+
+    page = client.get(f"/files/{key}")
+    named = client.get(f"/files/{key}", params={"filename": "page.html"})
+    pdf = client.get(f"/files/{pdf_key}")
+
+    assert page.headers["content-disposition"] == "attachment"
+    assert page.headers["x-content-type-options"] == "nosniff"
+    assert named.headers["content-disposition"].startswith("attachment;")
+    assert "content-disposition" not in pdf.headers
@@ -0,0 +1,310 @@
+import asyncio
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import asyncpg
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infra.database.config import ConnectionConfig
+from app.infra.database.listener import PostgresListener
+from app.infra.server.config import SERVER_PROFILES
+from app.main import app
+from app.meetings.concepts import LiveTopic
+from app.meetings.live import (
+    HEARTBEAT,
+    LIVE_CHANNEL,
+    LiveConfig,
+    LiveHub,
+    get_live_hub,
+    subscriber_limit,
+)
+from app.meetings.routes import router
+from app.settings import LIVE_CONFIG, SERVER_CONFIG
+
+
+def notification(table: str, key: object) -> str:
+    return orjson.dumps({"table": table, "op": "INSERT", "key": key}).decode()
+
+
+def parse(frame: bytes) -> tuple[str, dict]:
+    event, data = frame.decode().splitlines()[:2]
+    return event.removeprefix("event: "), orjson.loads(data[len("data: ") :])
+
+
+async def first_event(hub: LiveHub, topics=None) -> bytes:
+    subscription = hub.subscribe(topics)
+    assert subscription is not None
+    stream = hub.stream(subscription)
+    try:
+        assert (await anext(stream)).startswith(b"retry:")
+        return await anext(stream)
+    finally:
+        await stream.aclose()
+
+
+def test_notifications_are_coalesced_per_topic():
+    async def scenario():
+        hub = LiveHub(LiveConfig(coalesce_window=0.01))
+        receiver = asyncio.create_task(first_event(hub, [LiveTopic.CHAMADAS]))
+        await asyncio.sleep(0)
+        for member in range(30):
+            hub.publish(notification("chamadas", 7 if member < 20 else 8))
+        hub.publish(notification("caixa", "2025-03-01"))
+
+        event, data = parse(await receiver)
+        assert event == "chamadas"
+        assert data == {"count": 30, "keys": [7, 8]}
+        assert not hub.subscriptions
+
+    asyncio.run(scenario())
+
+
+def test_one_event_fans_out_to_many_subscribers():
+    async def scenario():
+        hub = LiveHub(LiveConfig(coalesce_window=0.01, max_subscribers=5000))
+        receivers = [asyncio.create_task(first_event(hub)) for _ in range(5000)]
+        await asyncio.sleep(0)
+        assert len(hub.subscriptions) == 5000
+
+        started = time.perf_counter()
+        hub.publish(notification("pontuacao_bonus", 3))
+        frames = await asyncio.gather(*receivers)
+        elapsed = time.perf_counter() - started
+
+        assert len(set(frames)) == 1
+        assert parse(frames[0]) == (
+            "pontuacao_bonus",
+            {"count": 1, "keys": [3]},
+        )
+        assert not hub.subscriptions
+        assert elapsed < 5
+
+    asyncio.run(scenario())
+
+
+def test_slow_consumer_is_dropped():
+    async def scenario():
+        hub = LiveHub(LiveConfig(max_queue=2))
+        slow = hub.subscribe()
+        assert slow is not None
+        for _ in range(3):
+            hub._broadcast(HEARTBEAT)
+
+        assert slow.dropped
+        assert slow not in hub.subscriptions
+        frames = [frame async for frame in hub.stream(slow)]
+        assert frames == [b"retry: 3000\n\n"]
+
+    asyncio.run(scenario())
+
+
+def test_heartbeat_and_shutdown_end_idle_streams():
+    async def scenario():
+        hub = LiveHub(LiveConfig(heartbeat_interval=0.01))
+        hub.start()
+        subscription = hub.subscribe()
+        assert subscription is not None
+        stream = hub.stream(subscription)
+        assert (await anext(stream)).startswith(b"retry:")
+        assert await anext(stream) == HEARTBEAT
+
+        await hub.aclose()
+        with pytest.raises(StopAsyncIteration):
+            while True:
+                assert await anext(stream) == HEARTBEAT
+
+    asyncio.run(scenario())
+
+
+def test_live_route_streams_events():
+    async def scenario():
+        hub = LiveHub(LiveConfig(coalesce_window=0.01))
+        live_app = FastAPI()
+        live_app.include_router(router, prefix="/meetings")
+        live_app.dependency_overrides[get_live_hub] = lambda: hub
+        sent: list[dict] = []
+        disconnect = asyncio.Event()
+
+        async def receive():
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+            if message.get("body", b"").startswith(b"retry:"):
+                hub.publish(notification("caixa", "2025-03-01"))
+            elif message.get("body"):
+                disconnect.set()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/meetings/live",
+            "raw_path": b"/meetings/live",
+            "root_path": "",
+            "query_string": b"topics=caixa",
+            "headers": [],
+            "server": ("testserver", 80),
+            "client": ("testclient", 50000),
+        }
+        await asyncio.wait_for(live_app(scope, receive, send), timeout=5)
+
+        headers = dict(sent[0]["headers"])
+        assert sent[0]["status"] == 200
+        assert headers[b"content-type"].startswith(b"text/event-stream")
+        assert parse(sent[2]["body"]) == (
+            "caixa",
+            {"count": 1, "keys": ["2025-03-01"]},
+        )
+        assert not hub.subscriptions
+
+    asyncio.run(scenario())
+
+
+def test_live_streams_leave_worker_connections_free():
+    for runtime in SERVER_PROFILES.values():
+        limit = subscriber_limit(runtime.connection_budget, reserved=32)
+        assert 0 < limit <= runtime.connection_budget - 32
+        assert subscriber_limit(runtime.connection_budget, 32, 10_000) == limit
+        assert subscriber_limit(runtime.connection_budget, 32, 8) == 8
+
+    assert LIVE_CONFIG.max_subscribers < SERVER_CONFIG.runtime.connection_budget
+
+
+def test_live_route_rejects_when_full():
+    hub = LiveHub(LiveConfig(max_subscribers=0))
+    app.dependency_overrides[get_live_hub] = lambda: hub
+    try:
+        response = TestClient(app).get("/meetings/live")
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "3"
+
+
+def test_triggers_notify_the_listened_channel():
+    init_sql = (Path(__file__).parents[2] / "init.sql").read_text()
+    notify = init_sql[init_sql.index("FUNCTION public.notify_live_change") :]
+
+    assert f"pg_notify(\n\t\t'{LIVE_CHANNEL}'," in notify
+
+
+class FakeConnection:
+    def __init__(
+        self, error: Exception | None = None, stale: bool = False
+    ) -> None:
+        self.error = error
+        self.stale = stale
+        self.closed = False
+        self.notify: Callable[[object, int, str, str], None] = lambda *_: None
+        self.on_terminate: Callable[[FakeConnection], None] = lambda _: None
+        self.listening = asyncio.Event()
+
+    def add_termination_listener(
+        self, callback: Callable[["FakeConnection"], None]
+    ) -> None:
+        self.on_terminate = callback
+
+    async def add_listener(
+        self, _channel: str, callback: Callable[[object, int, str, str], None]
+    ) -> None:
+        if self.error is not None:
+            raise self.error
+        self.notify = callback
+        self.listening.set()
+
+    async def execute(self, _query: str, timeout: float) -> str:
+        if self.stale:
+            # A half-open connection: the query never gets an answer.
+            await asyncio.sleep(timeout)
+            raise TimeoutError
+        return "SELECT 1"
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def terminate(self) -> None:
+        self.closed = True
+
+    def drop(self) -> None:
+        self.closed = True
+        self.on_terminate(self)
+
+
+def test_listener_retries_failed_listen(monkeypatch):
+    async def scenario():
+        broken = FakeConnection(asyncpg.ConnectionDoesNotExistError())
+        first, second = FakeConnection(), FakeConnection()
+        attempts: list[OSError | FakeConnection] = [
+            OSError("connection refused"),
+            broken,
+            first,
+            second,
+        ]
+        payloads: list[str] = []
+        reconnects: list[None] = []
+
+        async def connect() -> FakeConnection:
+            attempt = attempts.pop(0)
+            if isinstance(attempt, Exception):
+                raise attempt
+            return attempt
+
+        listener = PostgresListener(
+            connection=ConnectionConfig(host="", user="", password="", name=""),
+            channel="pc_live",
+            on_notify=payloads.append,
+            on_reconnect=lambda: reconnects.append(None),
+            min_backoff=0.001,
+        )
+        monkeypatch.setattr(listener, "_connect", connect)
+        listener.start()
+
+        await asyncio.wait_for(first.listening.wait(), timeout=5)
+        first.notify(None, 1, "pc_live", "payload")
+        first.drop()
+        await asyncio.wait_for(second.listening.wait(), timeout=5)
+
+        assert broken.closed
+        assert payloads == ["payload"]
+        assert reconnects == [None]
+        await listener.aclose()
+
+    asyncio.run(scenario())
+
+
+def test_listener_reconnects_when_probe_goes_unanswered(monkeypatch):
+    async def scenario():
+        stale, fresh = FakeConnection(stale=True), FakeConnection()
+        attempts = [stale, fresh]
+        reconnects: list[None] = []
+
+        async def connect() -> FakeConnection:
+            return attempts.pop(0)
+
+        listener = PostgresListener(
+            connection=ConnectionConfig(host="", user="", password="", name=""),
+            channel="pc_live",
+            on_notify=lambda _: None,
+            on_reconnect=lambda: reconnects.append(None),
+            min_backoff=0.001,
+            probe_interval=0.01,
+            probe_timeout=0.01,
+        )
+        monkeypatch.setattr(listener, "_connect", connect)
+        listener.start()
+
+        await asyncio.wait_for(fresh.listening.wait(), timeout=5)
+
+        assert stale.closed
+        assert reconnects == [None]
+        await listener.aclose()
+
+    asyncio.run(scenario())
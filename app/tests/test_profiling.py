@@ -0,0 +1,123 @@
+import asyncio
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.exc import APIError, api_error_handler
+from app.api.profiling import (
+    ProfileStore,
+    ProfilingConfig,
+    ProfilingMiddleware,
+)
+from app.api.routes import router
+from app.main import app as main_app
+
+
+def make_client(config: ProfilingConfig) -> TestClient:
+    app = FastAPI()
+    app.add_exception_handler(APIError, api_error_handler)  # pyright: ignore[reportArgumentType]
+    app.state.profiles = ProfileStore(config)
+    app.include_router(router)
+
+    @app.get("/slow")
+    async def slow():
+        await asyncio.sleep(0.01)
+        return orjson.loads(orjson.dumps([{"n": n} for n in range(10_000)]))
+
+    app.add_middleware(
+        ProfilingMiddleware, config=config, store=app.state.profiles
+    )
+    return TestClient(app)
+
+
+@pytest.fixture
+def config(tmp_path):
+    return ProfilingConfig(directory=tmp_path, token="secret", max_profiles=2)
+
+
+def test_disabled_by_default():
+    assert not ProfilingConfig().enabled
+    assert ProfilingMiddleware not in [m.cls for m in main_app.user_middleware]
+
+
+def test_requests_without_token_are_not_profiled(config, tmp_path):
+    response = make_client(config).get("/slow")
+
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+    assert not list(tmp_path.iterdir())
+
+
+def test_profile_is_captured_and_downloadable(config):
+    client = make_client(config)
+    response = client.get("/slow", headers={"X-Profile": "secret"})
+    profile_id = response.headers["x-profile-id"]
+
+    speedscope = client.get(
+        f"/profiles/{profile_id}", headers={"X-Profile": "secret"}
+    )
+    assert speedscope.status_code == 200
+    assert "speedscope" in speedscope.json()["$schema"]
+
+    html = client.get(
+        f"/profiles/{profile_id}",
+        params={"format": "html"},
+        headers={"X-Profile": "secret"},
+    )
+    assert html.headers["content-type"].startswith("text/html")
+
+
+def test_download_requires_token_and_known_id(config):
+    client = make_client(config)
+    profile_id = client.get("/slow", headers={"X-Profile": "secret"}).headers[
+        "x-profile-id"
+    ]
+
+    assert client.get(f"/profiles/{profile_id}").status_code == 403
+    assert (
+        client.get(
+            f"/profiles/{profile_id}", headers={"X-Profile": "wrong"}
+        ).status_code
+        == 403
+    )
+    assert (
+        client.get(
+            "/profiles/prof_00000000000000000000000000",
+            headers={"X-Profile": "secret"},
+        ).status_code
+        == 404
+    )
+
+
+def test_sampling_keeps_newest_profiles(tmp_path):
+    client = make_client(
+        ProfilingConfig(
+            directory=tmp_path, token="secret", sample_rate=1.0, max_profiles=2
+        )
+    )
+    ids = [client.get("/health").headers["x-profile-id"] for _ in range(3)]
+
+    assert sorted(path.stem for path in tmp_path.iterdir()) == sorted(ids[1:])
+
+
+def test_sampling_requires_a_token(tmp_path):
+    with pytest.raises(ValueError, match="PROFILING_TOKEN"):
+        _ = ProfilingConfig(directory=tmp_path, sample_rate=0.5)
+
+
+def test_exempt_paths_are_never_profiled(tmp_path):
+    client = make_client(
+        ProfilingConfig(
+            directory=tmp_path,
+            token="secret",
+            sample_rate=1.0,
+            exempt_paths=("/health",),
+        )
+    )
+
+    response = client.get("/health", headers={"X-Profile": "secret"})
+
+    assert "x-profile-id" not in response.headers
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,25 @@
+from granian.constants import HTTPModes, Loops
+
+from app.infra.server.adapter import create_server
+from app.infra.server.config import SERVER_PROFILES, ServerConfig, ServerProfile
+
+
+def test_every_profile_is_defined():
+    assert set(SERVER_PROFILES) == set(ServerProfile)
+
+
+def test_create_server_applies_profile():
+    runtime = SERVER_PROFILES[ServerProfile.LOW_MEMORY]
+    server = create_server(
+        "app.main:app", ServerConfig(host="127.0.0.1", runtime=runtime)
+    )
+    assert server.workers == runtime.workers
+    assert server.backpressure == runtime.backpressure
+    assert server.http == HTTPModes.http1
+    assert server.loop == Loops.uvloop
+    assert server.http1_settings is not None
+    assert server.http1_settings.keep_alive
+    assert not server.log_access
+    assert server.workers_lifetime == runtime.workers_lifetime
+    assert runtime.workers_max_rss is not None
+    assert server.workers_rss == runtime.workers_max_rss * 1024 * 1024
@@ -0,0 +1,128 @@
+"""
+CPU vs bytes trade-off of the response compression codings.
+
+Usage: python -m benchmarks.compression [--repeat N]
+
+Builds JSON payloads shaped like the meeting list, treasury ledger and
+ranking responses, and prints, for each coding and level, the compression
+ratio and the time spent per response, plus the cost of a cache hit
+(hashing the body) in the compression middleware.
+"""
+
+import argparse
+import hashlib
+import random
+import time
+from datetime import date, timedelta
+
+import orjson
+
+from app.api.compression import ENCODERS
+
+LEVELS = {
+    "gzip": (1, 6, 9),
+    "br": (1, 4, 6, 11),
+    "zstd": (1, 3, 9, 19),
+}
+
+
+def meetings(count: int = 300) -> bytes:
+    start = date(2025, 1, 4)
+    return orjson.dumps(
+        [
+            {
+                "id": i,
+                "nome": f"Reunião {'Normal' if i % 4 else 'Especial'}",
+                "data": start + timedelta(weeks=i),
+                "chamadas": [
+                    {
+                        "codigo_sgc": f"{1000 + member}",
+                        "presenca": 10,
+                        "pontualidade": random.choice((0, 5, 10)),
+                        "uniforme": random.choice((0, 10)),
+                        "modestia": 10,
+                    }
+                    for member in range(8)
+                ],
+            }
+            for i in range(count)
+        ]
+    )
+
+
+def ledger(count: int = 2000) -> bytes:
+    start = date(2025, 1, 1)
+    return orjson.dumps(
+        [
+            {
+                "id": i,
+                "tipo": random.choice(("entrada", "saida")),
+                "descricao": random.choice(
+                    ("Mensalidade", "Inscrição evento", "Material", "Lanche")
+                ),
+                "valor": round(random.uniform(5, 300), 2),
+                "data": start + timedelta(days=i % 365),
+                "id_evento": random.choice((None, 1, 2, 3)),
+            }
+            for i in range(count)
+        ]
+    )
+
+
+def ranking(count: int = 40) -> bytes:
+    return orjson.dumps(
+        [
+            {
+                "unidade_id": i,
+                "nome": f"Unidade {i}",
+                "pontos": random.randint(0, 5000),
+                "bonus": random.randint(0, 500),
+            }
+            for i in range(count)
+        ]
+    )
+
+
+def measure(data: bytes, coding: str, level: int, repeat: int) -> tuple:
+    compress = ENCODERS[coding].compress
+    compressed = compress(data, level)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        compress(data, level)
+    elapsed = (time.perf_counter() - started) / repeat
+    return len(compressed), elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").strip().splitlines()[0]
+    )
+    _ = parser.add_argument("--repeat", type=int, default=50)
+    repeat = parser.parse_args().repeat
+    random.seed(0)
+
+    for name, data in (
+        ("meetings", meetings()),
+        ("ledger", ledger()),
+        ("ranking", ranking()),
+    ):
+        print(f"\n{name}: {len(data)} bytes\n")
+        print("| coding | level | bytes | ratio | ms/response | MB/s |")
+        print("|---|---|---|---|---|---|")
+        for coding, levels in LEVELS.items():
+            for level in levels:
+                size, elapsed = measure(data, coding, level, repeat)
+                print(
+                    f"| {coding} | {level} | {size} "
+                    f"| {len(data) / size:.1f}x | {elapsed * 1000:.3f} "
+                    f"| {len(data) / elapsed / 1e6:.0f} |"
+                )
+        started = time.perf_counter()
+        for _ in range(repeat):
+            hashlib.sha256(data).digest()
+        elapsed = (time.perf_counter() - started) / repeat
+        print(f"| cache hit | - | - | - | {elapsed * 1000:.3f} | - |")
+
+
+if __name__ == "__main__":
+    main()
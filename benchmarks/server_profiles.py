@@ -0,0 +1,215 @@
+"""
+Throughput, latency and memory of the Granian runtime profiles.
+
+Usage: python -m benchmarks.server_profiles [--duration S] [--connections N]
+                                            [--workers N] [--profile NAME]
+
+Starts the API under each profile in `SERVER_PROFILES`, with the profile's
+own worker count unless `--workers` is given, and drives it with
+keep-alive HTTP/1.1 connections for `--duration` seconds against two routes:
+`/health` (no I/O) and `/bench/io`, which waits 5 ms as if it were querying
+the database and returns a ~20 KB JSON list. Prints requests per second,
+latency percentiles and the resident memory of the server processes.
+
+The application runs without its lifespan, so no database is needed, and
+without the admission control middleware, so every request reaches the
+route and the numbers compare the servers rather than load shedding.
+"""
+
+import argparse
+import asyncio
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from app.api.admission import AdmissionMiddleware
+from app.infra.server.config import SERVER_PROFILES, ServerConfig, ServerProfile
+from app.main import get_app
+
+ROUTES = ("/health", "/bench/io")
+
+
+@asynccontextmanager
+async def _no_lifespan(_app):
+    yield
+
+
+app = get_app()
+app.router.lifespan_context = _no_lifespan
+app.user_middleware = [
+    middleware
+    for middleware in app.user_middleware
+    if middleware.cls is not AdmissionMiddleware
+]
+
+
+@app.get("/bench/io")
+async def bench_io():
+    await asyncio.sleep(0.005)
+    return [
+        {"codigo_sgc": f"{1000 + i}", "nome": f"Membro {i}", "pontos": i * 7}
+        for i in range(300)
+    ]
+
+
+# Load generator #
+
+
+async def _request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, raw: bytes
+) -> bool:
+    writer.write(raw)
+    head = await reader.readuntil(b"\r\n\r\n")
+    status_line, *lines = head.split(b"\r\n")
+    length = 0
+    for line in lines:
+        name, _, value = line.partition(b":")
+        if name.lower() == b"content-length":
+            length = int(value)
+    _ = await reader.readexactly(length)
+    return status_line.split()[1] == b"200"
+
+
+async def _connection(
+    port: int,
+    path: str,
+    deadline: float,
+    latencies: list[float],
+    errors: list[int],
+) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    raw = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            if await _request(reader, writer, raw):
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors.append(1)
+    finally:
+        writer.close()
+
+
+async def load(
+    port: int, path: str, connections: int, duration: float
+) -> tuple[float, list[float], int]:
+    latencies: list[float] = []
+    errors: list[int] = []
+    started = time.perf_counter()
+    deadline = started + duration
+    _ = await asyncio.gather(
+        *(
+            _connection(port, path, deadline, latencies, errors)
+            for _ in range(connections)
+        )
+    )
+    return time.perf_counter() - started, latencies, len(errors)
+
+
+# Server process #
+
+
+def _rss_kib(pid: int) -> int:
+    total = 0
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            total = int(line.split()[1])
+    for task in Path(f"/proc/{pid}/task").iterdir():
+        for child in (task / "children").read_text().split():
+            total += _rss_kib(int(child))
+    return total
+
+
+def _wait_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"server did not listen on port {port}")
+
+
+def serve(profile: ServerProfile, port: int, workers: int | None) -> None:
+    from app.infra.server.adapter import create_server
+
+    runtime = SERVER_PROFILES[profile]
+    if workers is not None:
+        runtime = runtime.model_copy(update={"workers": workers})
+    config = ServerConfig(host="127.0.0.1", port=port, runtime=runtime)
+    create_server("benchmarks.server_profiles:app", config).serve()
+
+
+def run(profile: ServerProfile, args: argparse.Namespace) -> None:
+    workers = args.workers or SERVER_PROFILES[profile].workers
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.server_profiles",
+            "--serve",
+            profile,
+            "--workers",
+            str(workers),
+            "--port",
+            str(args.port),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_port(args.port)
+        idle_rss = _rss_kib(server.pid)
+        for path in ROUTES:
+            _ = asyncio.run(load(args.port, path, args.connections, 1.0))
+            elapsed, latencies, errors = asyncio.run(
+                load(args.port, path, args.connections, args.duration)
+            )
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"| {profile} | {workers} | {path} "
+                f"| {len(latencies) / elapsed:.0f} "
+                f"| {quantiles[49] * 1000:.2f} | {quantiles[98] * 1000:.2f} "
+                f"| {max(latencies) * 1000:.2f} | {errors} "
+                f"| {idle_rss // 1024} | {_rss_kib(server.pid) // 1024} |"
+            )
+    finally:
+        server.terminate()
+        _ = server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").strip().splitlines()[0]
+    )
+    _ = parser.add_argument("--duration", type=float, default=10.0)
+    _ = parser.add_argument("--connections", type=int, default=32)
+    _ = parser.add_argument("--workers", type=int)
+    _ = parser.add_argument("--port", type=int, default=8765)
+    _ = parser.add_argument("--profile", choices=list(ServerProfile))
+    _ = parser.add_argument("--serve", choices=list(ServerProfile))
+    args = parser.parse_args()
+    if args.serve:
+        serve(ServerProfile(args.serve), args.port, args.workers)
+        return
+
+    print(
+        f"\n{args.connections} connections, {args.duration:.0f} s per route\n"
+    )
+    print(
+        "| profile | workers | route | req/s | p50 ms | p99 ms | max ms "
+        "| errors | RSS idle MiB | RSS MiB |"
+    )
+    print("|---|---|---|---|---|---|---|---|---|---|")
+    profiles = [ServerProfile(args.profile)] if args.profile else ServerProfile
+    for profile in profiles:
+        run(profile, args)
+
+
+if __name__ == "__main__":
+    main()
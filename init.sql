@@ -504,3 +504,190 @@ CREATE TABLE public.inscricao_eventos (
 	CONSTRAINT inscricao_eventos_codigo_sgc_fkey FOREIGN KEY (codigo_sgc) REFERENCES public.membros(codigo_sgc) ON UPDATE CASCADE,
 	CONSTRAINT inscricao_eventos_id_evento_fkey FOREIGN KEY (id_evento) REFERENCES public.evento(id)
 );
+
+
+-- public.progresso_classes definição
+
+-- Drop table
+
+-- DROP TABLE public.progresso_classes;
+
+CREATE TABLE public.progresso_classes (
+	id_unidade int4 NOT NULL,
+	codigo_classe text NOT NULL,
+	aprovados int4 DEFAULT 0 NOT NULL,
+	em_avaliacao int4 DEFAULT 0 NOT NULL,
+	refazer int4 DEFAULT 0 NOT NULL,
+	CONSTRAINT progresso_classes_pkey PRIMARY KEY (id_unidade, codigo_classe)
+);
+
+
+-- public.progresso_especialidades definição
+
+-- Drop table
+
+-- DROP TABLE public.progresso_especialidades;
+
+CREATE TABLE public.progresso_especialidades (
+	codigo_sgc text NOT NULL,
+	codigo_especialidade text NOT NULL,
+	aprovados int4 DEFAULT 0 NOT NULL,
+	em_avaliacao int4 DEFAULT 0 NOT NULL,
+	refazer int4 DEFAULT 0 NOT NULL,
+	CONSTRAINT progresso_especialidades_pkey PRIMARY KEY (codigo_sgc, codigo_especialidade)
+);
+
+
+-- public.ajusta_progresso_classes definição
+-- Soma `sinal` (1 ou -1) ao contador do status em progresso_classes.
+
+-- DROP FUNCTION public.ajusta_progresso_classes(int4, int4, text, int4);
+
+CREATE OR REPLACE FUNCTION public.ajusta_progresso_classes(p_id_unidade int4, p_id_requisito int4, p_status text, sinal int4)
+ RETURNS void
+ LANGUAGE sql
+AS $function$
+	INSERT INTO public.progresso_classes AS p (id_unidade, codigo_classe, aprovados, em_avaliacao, refazer)
+	SELECT p_id_unidade, rc.codigo_classe,
+		sinal * (p_status = 'Aprovado')::int4,
+		sinal * (p_status = 'Avaliação')::int4,
+		sinal * (p_status = 'Refazer')::int4
+	FROM public.requisitos_classes rc
+	WHERE rc.id = p_id_requisito
+	ON CONFLICT (id_unidade, codigo_classe) DO UPDATE SET
+		aprovados = p.aprovados + EXCLUDED.aprovados,
+		em_avaliacao = p.em_avaliacao + EXCLUDED.em_avaliacao,
+		refazer = p.refazer + EXCLUDED.refazer;
+$function$;
+
+
+-- public.ajusta_progresso_especialidades definição
+-- Soma `sinal` (1 ou -1) ao contador do status em progresso_especialidades.
+
+-- DROP FUNCTION public.ajusta_progresso_especialidades(text, text, text, int4);
+
+CREATE OR REPLACE FUNCTION public.ajusta_progresso_especialidades(p_codigo_sgc text, p_codigo_especialidade text, p_status text, sinal int4)
+ RETURNS void
+ LANGUAGE sql
+AS $function$
+	INSERT INTO public.progresso_especialidades AS p (codigo_sgc, codigo_especialidade, aprovados, em_avaliacao, refazer)
+	VALUES (
+		p_codigo_sgc, p_codigo_especialidade,
+		sinal * (p_status = 'Aprovado')::int4,
+		sinal * (p_status = 'Avaliação')::int4,
+		sinal * (p_status = 'Refazer')::int4
+	)
+	ON CONFLICT (codigo_sgc, codigo_especialidade) DO UPDATE SET
+		aprovados = p.aprovados + EXCLUDED.aprovados,
+		em_avaliacao = p.em_avaliacao + EXCLUDED.em_avaliacao,
+		refazer = p.refazer + EXCLUDED.refazer;
+$function$;
+
+
+-- public.atualiza_progresso definição
+-- Mantém os contadores de progresso a cada INSERT, UPDATE ou DELETE em
+-- avaliacao_classes e avaliacao_especialidade, na mesma transação da escrita:
+-- a linha antiga é descontada e a nova somada.
+
+-- DROP FUNCTION public.atualiza_progresso();
+
+CREATE OR REPLACE FUNCTION public.atualiza_progresso()
+ RETURNS trigger
+ LANGUAGE plpgsql
+AS $function$
+BEGIN
+	IF TG_OP <> 'INSERT' THEN
+		IF TG_TABLE_NAME = 'avaliacao_classes' THEN
+			PERFORM public.ajusta_progresso_classes(OLD.id_unidade, OLD.id_requisito, OLD.status, -1);
+		ELSE
+			PERFORM public.ajusta_progresso_especialidades(OLD.codigo_sgc, OLD.codigo_especialidade, OLD.status, -1);
+		END IF;
+	END IF;
+	IF TG_OP <> 'DELETE' THEN
+		IF TG_TABLE_NAME = 'avaliacao_classes' THEN
+			PERFORM public.ajusta_progresso_classes(NEW.id_unidade, NEW.id_requisito, NEW.status, 1);
+		ELSE
+			PERFORM public.ajusta_progresso_especialidades(NEW.codigo_sgc, NEW.codigo_especialidade, NEW.status, 1);
+		END IF;
+	END IF;
+	RETURN NULL;
+END;
+$function$;
+
+CREATE TRIGGER avaliacao_classes_progresso AFTER INSERT OR DELETE OR UPDATE OF status, id_unidade, id_requisito ON public.avaliacao_classes
+	FOR EACH ROW EXECUTE FUNCTION public.atualiza_progresso();
+CREATE TRIGGER avaliacao_especialidade_progresso AFTER INSERT OR DELETE OR UPDATE OF status, codigo_sgc, codigo_especialidade ON public.avaliacao_especialidade
+	FOR EACH ROW EXECUTE FUNCTION public.atualiza_progresso();
+
+-- Contadores das avaliações que já existiam antes dos triggers.
+
+INSERT INTO public.progresso_classes (id_unidade, codigo_classe, aprovados, em_avaliacao, refazer)
+SELECT ac.id_unidade, rc.codigo_classe,
+	count(*) FILTER (WHERE ac.status = 'Aprovado'),
+	count(*) FILTER (WHERE ac.status = 'Avaliação'),
+	count(*) FILTER (WHERE ac.status = 'Refazer')
+FROM public.avaliacao_classes ac
+JOIN public.requisitos_classes rc ON rc.id = ac.id_requisito
+GROUP BY ac.id_unidade, rc.codigo_classe
+ON CONFLICT DO NOTHING;
+
+INSERT INTO public.progresso_especialidades (codigo_sgc, codigo_especialidade, aprovados, em_avaliacao, refazer)
+SELECT codigo_sgc, codigo_especialidade,
+	count(*) FILTER (WHERE status = 'Aprovado'),
+	count(*) FILTER (WHERE status = 'Avaliação'),
+	count(*) FILTER (WHERE status = 'Refazer')
+FROM public.avaliacao_especialidade
+GROUP BY codigo_sgc, codigo_especialidade
+ON CONFLICT DO NOTHING;
+
+
+-- public.pontuacao_bonus definição
+
+-- Drop table
+
+-- DROP TABLE public.pontuacao_bonus;
+
+CREATE TABLE public.pontuacao_bonus (
+	id serial4 NOT NULL,
+	tipo varchar(10) NOT NULL,
+	id_referencia int4 NOT NULL,
+	pontos int4 NOT NULL,
+	descricao text NULL,
+	"data" date DEFAULT CURRENT_DATE NOT NULL,
+	CONSTRAINT pontuacao_bonus_pkey PRIMARY KEY (id),
+	CONSTRAINT tipo_check CHECK (tipo IN ('unidade', 'membro'))
+);
+
+
+-- public.notify_live_change definição
+-- Envia um pg_notify no canal pc_live a cada alteração, com a tabela, a
+-- operação e o valor da coluna passada como argumento do trigger. O canal é
+-- fixo: se mudar aqui, mude também LIVE_CHANNEL em app/meetings/live.py.
+
+-- DROP FUNCTION public.notify_live_change();
+
+CREATE OR REPLACE FUNCTION public.notify_live_change()
+ RETURNS trigger
+ LANGUAGE plpgsql
+AS $function$
+DECLARE
+	linha jsonb := to_jsonb(COALESCE(NEW, OLD));
+BEGIN
+	PERFORM pg_notify(
+		'pc_live',
+		jsonb_build_object(
+			'table', TG_TABLE_NAME,
+			'op', TG_OP,
+			'key', linha -> TG_ARGV[0]
+		)::text
+	);
+	RETURN NULL;
+END;
+$function$;
+
+CREATE TRIGGER chamadas_live AFTER INSERT OR UPDATE OR DELETE ON public.chamadas
+	FOR EACH ROW EXECUTE FUNCTION public.notify_live_change('reuniao_id');
+CREATE TRIGGER pontuacao_bonus_live AFTER INSERT OR UPDATE OR DELETE ON public.pontuacao_bonus
+	FOR EACH ROW EXECUTE FUNCTION public.notify_live_change('id_referencia');
+CREATE TRIGGER caixa_live AFTER INSERT OR UPDATE OR DELETE ON public.caixa
+	FOR EACH ROW EXECUTE FUNCTION public.notify_live_change('data');